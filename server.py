@@ -5,11 +5,24 @@ Model Context Protocol server implementasyonu - Doğrudan MCP client bağlantıs
 """
 
 import asyncio
+import base64
+import contextvars
+import hashlib
+import io
 import json
 import logging
+import operator
 import os
+import re
+import shutil
 import sys
-from typing import Any, Dict, List, Optional, Sequence
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import numpy as np
@@ -26,28 +39,1493 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pyarrow opsiyonel - yoksa kolonlu önbellek devre dışı kalır
+    pa = None
+    pc = None
+    pa_csv = None
+    pa_ipc = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr opsiyonel - yoksa sayısal koşullar numpy ile değerlendirilir
+    numexpr = None
+
 # Logging konfigürasyonu
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("data-analysis-mcp")
 
-# Global veri depolama
-current_data: Optional[pd.DataFrame] = None
-data_info: Dict[str, Any] = {}
+# Yükleme konfigürasyonu
+CHUNK_SIZE = int(os.getenv("DATA_CHUNK_SIZE", "100000"))
+STREAMING_THRESHOLD_MB = float(os.getenv("DATA_STREAMING_THRESHOLD_MB", "100"))
+SUPPORTED_EXTENSIONS = ['.csv', '.xlsx', '.xls', '.json', '.ndjson', '.jsonl']
+COMPACT_ON_LOAD = os.getenv("DATA_COMPACT_ON_LOAD", "false").lower() == "true"
+CATEGORY_MAX_RATIO = float(os.getenv("DATA_CATEGORY_MAX_RATIO", "0.5"))
+DATE_DETECTION_SAMPLE = 1000
+DATE_LIKE_PATTERN = r"^\s*\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}"
+
+# Paralel CSV ayrıştırma konfigürasyonu
+CSV_PARSE_WORKERS = int(os.getenv("CSV_PARSE_WORKERS", str(os.cpu_count() or 1)))
+PARALLEL_CSV_MIN_MB = float(os.getenv("PARALLEL_CSV_MIN_MB", "32"))
+CSV_SCAN_BLOCK_SIZE = 16 * 1024 * 1024
+CSV_SAMPLE_ROWS = 1000
+# pd.read_csv'nin varsayılan eksik değer belirteçleri; Arrow okuyucusuna aynen verilir
+PANDAS_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+PANDAS_TRUE_VALUES = ['True', 'TRUE', 'true']
+PANDAS_FALSE_VALUES = ['False', 'FALSE', 'false']
+
+# JSON yükleme konfigürasyonu
+JSON_LINES_EXTENSIONS = ['.ndjson', '.jsonl']
+JSON_READ_BLOCK_SIZE = 4 * 1024 * 1024
+JSON_SEPARATOR_PATTERN = re.compile(r"[\s,]*")
+
+# Kolonlu önbellek konfigürasyonu (Arrow IPC)
+CACHE_ENABLED = os.getenv("DATA_CACHE_ENABLED", "true").lower() == "true"
+CACHE_DIR = os.getenv("DATA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "data-agent"))
+CACHE_MAX_MB = float(os.getenv("DATA_CACHE_MAX_MB", "2048"))
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+STORAGE_MODES = ["memory", "arrow_mmap", "out_of_core"]
+DATA_STORAGE = os.getenv("DATA_STORAGE", "memory")
+
+# Out-of-core konfigürasyonu: parçalar önbellek boyut sınırına tabi değildir
+OUT_OF_CORE_DIR = os.getenv("DATA_OUT_OF_CORE_DIR", os.path.join(CACHE_DIR, "partitions"))
+GROUP_MERGE_BATCH = 8
+
+# Kaynak sayfalama konfigürasyonu
+RESOURCE_PAGE_SIZE = int(os.getenv("RESOURCE_PAGE_SIZE", "1000"))
+RESOURCE_MAX_PAGE_SIZE = int(os.getenv("RESOURCE_MAX_PAGE_SIZE", "100000"))
+RESOURCE_FORMATS = ['json', 'ndjson', 'arrow']
+NDJSON_BATCH_ROWS = 5000
+
+# Yaklaşık profil konfigürasyonu
+PROFILE_SAMPLE_SIZE = int(os.getenv("PROFILE_SAMPLE_SIZE", "10000"))
+CONFIDENCE_Z = 1.96  # %95 güven aralığı
+
+# Taslak (sketch) konfigürasyonu: kantiller için KLL, farklı değer sayısı için HyperLogLog
+QUANTILE_SKETCH_K = int(os.getenv("QUANTILE_SKETCH_K", "1024"))
+HLL_PRECISION = 14  # 2^14 register, ~%0.8 standart hata
+SKETCH_BATCH_ROWS = 65536
+APPROX_QUANTILE_MIN_ROWS = int(os.getenv("APPROX_QUANTILE_MIN_ROWS", "5000000"))
+
+# Sütun indeksi konfigürasyonu
+INDEX_MIN_LOOKUPS = int(os.getenv("INDEX_MIN_LOOKUPS", "2"))
+HASH_INDEX_MAX_KEYS = int(os.getenv("HASH_INDEX_MAX_KEYS", "1000000"))
+INDEXABLE_OPERATORS = ["==", "in", ">", "<", ">=", "<=", "between"]
+
+# Zone map (blok min/max) konfigürasyonu
+ZONE_MAP_BLOCK_ROWS = int(os.getenv("ZONE_MAP_BLOCK_ROWS", "65536"))
+ZONE_MAP_OPERATORS = ["==", ">", "<", ">=", "<=", "between"]
+
+# Araç yürütme konfigürasyonu
+TOOL_WORKERS = int(os.getenv("TOOL_WORKERS", "4"))
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "300"))
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", str(os.cpu_count() or 1)))
+PARALLEL_MIN_ROWS = int(os.getenv("PARALLEL_MIN_ROWS", "1000000"))
+
+# Ağır pandas işleri event loop'u bloklamasın diye worker thread'lerde çalışır
+tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="data-tool")
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar("cancel_event", default=None)
+# Worker thread'lerin arka plan işi başlatabilmesi için çağıran event loop
+_worker_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar("worker_loop",
+                                                                                                  default=None)
+
+class ToolCancelled(Exception):
+    """Araç çağrısı zaman aşımı veya istemci isteğiyle iptal edildi"""
+
+def check_cancelled():
+    """Çalışan araç iptal edildiyse işlemi durdurur"""
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise ToolCancelled("İşlem iptal edildi")
+
+# Blok hesapları ayrı havuzda çalışır: araç worker'ları blokları beklerken havuz tükenmez
+compute_executor = ThreadPoolExecutor(max_workers=max(PARALLEL_WORKERS, 1), thread_name_prefix="data-compute")
+
+def row_blocks(items: int, rows: Optional[int] = None) -> List[Tuple[int, int]]:
+    """[0, items) aralığını paralel işlenecek bloklara böler; küçük tablolar (rows) tek blok kalır"""
+    rows = items if rows is None else rows
+    if PARALLEL_WORKERS <= 1 or rows < PARALLEL_MIN_ROWS:
+        return [(0, items)]
+    bounds = np.linspace(0, items, PARALLEL_WORKERS + 1).astype(np.int64).tolist()
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if start < end]
+
+def parallel_map(func: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+    """Öğeleri hesaplama havuzunda paralel işler; iptal bağlamı blok işlerine taşınır"""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    futures = [compute_executor.submit(contextvars.copy_context().run, func, item) for item in items]
+    return [future.result() for future in futures]
+
+async def run_in_worker(func, *args, timeout: float = TOOL_TIMEOUT_SECONDS):
+    """Bloklayan fonksiyonu worker thread'de zaman aşımı ve iptal desteğiyle çalıştırır"""
+    cancel_event = threading.Event()
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    context.run(_cancel_event.set, cancel_event)
+    context.run(_worker_loop.set, loop)
+    
+    future = loop.run_in_executor(tool_executor, context.run, func, *args)
+    
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        # Thread zorla durdurulamaz; işlem bir sonraki kontrol noktasında sonlanır
+        cancel_event.set()
+        raise
+
+def run_in_background(func, *args):
+    """Worker thread'den arka plan işi başlatır; iş de run_in_worker ile zaman aşımı ve iptal kontrolü altında çalışır"""
+    loop = _worker_loop.get()
+    
+    async def run():
+        try:
+            await run_in_worker(func, *args)
+        except asyncio.TimeoutError:
+            logger.warning(f"Arka plan işi zaman aşımına uğradı: {getattr(func, '__name__', func)}")
+        except Exception as e:
+            logger.error(f"Arka plan işi hatası: {str(e)}")
+    
+    if loop is None:
+        # Event loop dışında (ör. doğrudan çağrılan fonksiyonlar) iş senkron çalışır
+        func(*args)
+        return
+    asyncio.run_coroutine_threadsafe(run(), loop)
+
+# Veri seti kayıt defteri konfigürasyonu
+DEFAULT_DATASET = "default"
+DATASET_MEMORY_BUDGET_MB = float(os.getenv("DATASET_MEMORY_BUDGET_MB", "1024"))
+
+# Sonuç önbelleği konfigürasyonu
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "256"))
+CACHEABLE_TOOLS = ["filter_data", "calculate_statistics", "group_analysis"]
+
+_dataset_versions = count(1)
+
+class ReservoirSampler:
+    """Akan veri parçalarından sabit boyutlu, tekdüze rastgele örneklem tutar (Algorithm R)"""
+    
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = size
+        self.seen = 0
+        self.rng = np.random.default_rng(seed)
+        self._sample: Optional[pd.DataFrame] = None
+    
+    def update(self, chunk: pd.DataFrame):
+        """Yeni parçayı örnekleme dahil eder"""
+        n = len(chunk)
+        if n == 0:
+            return
+        
+        start = self.seen
+        self.seen += n
+        
+        # Örneklem dolana kadar satırlar doğrudan eklenir
+        current = 0 if self._sample is None else len(self._sample)
+        fill = min(self.size - current, n)
+        if fill > 0:
+            head = chunk.iloc[:fill]
+            self._sample = head.copy() if self._sample is None else pd.concat([self._sample, head], ignore_index=True)
+        if fill == n:
+            return
+        
+        # i. satır için j ~ U[0, i]; j < size ise j. slot ile yer değiştirir
+        positions = np.arange(start + fill, start + n)
+        slots = (self.rng.random(len(positions)) * (positions + 1)).astype(np.int64)
+        hits = slots < self.size
+        if not hits.any():
+            return
+        
+        rows = np.flatnonzero(hits) + fill
+        slots = slots[hits]
+        # Aynı slota birden fazla satır düşerse sıradaki son satır geçerlidir
+        last_slots, last_index = np.unique(slots[::-1], return_index=True)
+        rows = rows[::-1][last_index]
+        
+        keep = np.ones(len(self._sample), dtype=bool)
+        keep[last_slots] = False
+        self._sample = pd.concat([self._sample[keep], chunk.iloc[rows]], ignore_index=True)
+    
+    @property
+    def sample(self) -> Optional[pd.DataFrame]:
+        return self._sample
+
+class QuantileSketch:
+    """KLL tarzı birleştirilebilir kantil taslağı; h. seviyedeki her öğe 2^h satırı temsil eder"""
+    
+    def __init__(self, k: int = QUANTILE_SKETCH_K, seed: Optional[int] = None):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.rng = np.random.default_rng(seed)
+    
+    def update(self, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        # Küçük partiler halinde eklemek tek büyük sıralamadan belirgin biçimde ucuzdur
+        for start in range(0, len(values), SKETCH_BATCH_ROWS):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + SKETCH_BATCH_ROWS]])
+            self._compress()
+    
+    def merge(self, other: "QuantileSketch"):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+    
+    def _compress(self):
+        """Kapasiteyi aşan seviyeler sıralanıp rastgele ofsetle her ikinci öğe üst seviyeye taşınır"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # Tek sayıda öğe varsa biri aynı seviyede kalır
+                residual, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+                promoted = items[int(self.rng.integers(2))::2]
+                self.levels[level] = residual
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+    
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Ağırlıklı sıralı öğelerden kantilleri okur; uçlar kesin min/max'tır"""
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side='left')
+        result = items[np.minimum(positions, len(items) - 1)]
+        result = np.where(np.asarray(qs) <= 0, self.min, result)
+        return np.where(np.asarray(qs) >= 1, self.max, result)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'k': self.k, 'count': self.count, 'min': self.min, 'max': self.max,
+                'levels': [base64.b64encode(level.astype(np.float64).tobytes()).decode('ascii') for level in self.levels]}
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(state['k'])
+        sketch.count, sketch.min, sketch.max = state['count'], state['min'], state['max']
+        sketch.levels = [np.frombuffer(base64.b64decode(level), dtype=np.float64).copy() for level in state['levels']]
+        return sketch
+
+class HyperLogLog:
+    """Birleştirilebilir farklı değer sayısı tahmincisi (HyperLogLog, 64 bit hash)"""
+    
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+    
+    def update(self, values: pd.Series):
+        values = values.dropna()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        # İlk p bit register'ı, kalan bitlerdeki baştaki sıfır sayısı + 1 rank'ı belirler
+        buckets = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        bit_length = np.zeros(len(remainder), dtype=np.int64)
+        nonzero = remainder > 0
+        # Kalan bitler < 2^53 olduğundan float64 dönüşümü kesindir
+        bit_length[nonzero] = np.floor(np.log2(remainder[nonzero].astype(np.float64))).astype(np.int64) + 1
+        ranks = (64 - self.precision - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+    
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+    
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Küçük kardinalitede doğrusal sayım daha doğrudur
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'precision': self.precision, 'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(state['precision'])
+        sketch.registers = np.frombuffer(base64.b64decode(state['registers']), dtype=np.uint8).copy()
+        return sketch
+
+class ColumnSketch:
+    """Tek sütun için kantil (yalnızca sayısal) ve farklı değer taslakları; parçalar arasında birleştirilebilir"""
+    
+    def __init__(self, numeric: bool):
+        self.quantiles = QuantileSketch() if numeric else None
+        self.distinct = HyperLogLog()
+    
+    def update(self, values: pd.Series):
+        if self.quantiles is not None:
+            self.quantiles.update(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        self.distinct.update(values)
+    
+    def merge(self, other: "ColumnSketch"):
+        if self.quantiles is not None and other.quantiles is not None:
+            self.quantiles.merge(other.quantiles)
+        else:
+            # Parçalardan biri sayısal değilse kantil taslağı anlamını yitirir
+            self.quantiles = None
+        self.distinct.merge(other.distinct)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'quantiles': self.quantiles.to_dict() if self.quantiles is not None else None,
+                'distinct': self.distinct.to_dict()}
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "ColumnSketch":
+        sketch = cls(numeric=False)
+        sketch.quantiles = QuantileSketch.from_dict(state['quantiles']) if state['quantiles'] else None
+        sketch.distinct = HyperLogLog.from_dict(state['distinct'])
+        return sketch
+
+def build_column_sketch(values: pd.Series) -> ColumnSketch:
+    """Sütun taslağını satır bloklarında paralel oluşturup birleştirir"""
+    numeric = pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype)
+    
+    def block_sketch(bounds: Tuple[int, int]) -> ColumnSketch:
+        sketch = ColumnSketch(numeric)
+        sketch.update(values.iloc[bounds[0]:bounds[1]])
+        return sketch
+    
+    sketches = parallel_map(block_sketch, row_blocks(len(values)))
+    for other in sketches[1:]:
+        sketches[0].merge(other)
+    return sketches[0]
+
+class DataProfile:
+    """Veri profili - istatistikler ilk erişimde hesaplanır ve sütun bazında önbelleklenir"""
+    
+    def __init__(self, data: pd.DataFrame, data_source: Callable[[Optional[List[str]]], pd.DataFrame],
+                 partitions: Optional["PartitionedDataset"] = None,
+                 row_source: Optional[Callable[[np.ndarray], pd.DataFrame]] = None):
+        self._data_source = data_source
+        # Örneklem satırları pozisyonla okunur; parça ve görünümlerde tüm tablo açılmaz
+        self._row_source = row_source or (lambda positions: data_source(None).take(positions))
+        # Out-of-core veri setlerinde tüm sütun okunamaz; özetler parça parça hesaplanır
+        self._partitions = partitions
+        self._column_stats: Dict[str, Dict[str, Any]] = {}
+        self._sample: Optional[pd.DataFrame] = None
+        self.exact_profile_pending = False
+        self.dtypes: Dict[str, Any] = {}
+        self.update_schema(data)
+    
+    def update_schema(self, data: pd.DataFrame):
+        """Şema bilgisini yeniler; sadece tipi değişen sütunların istatistiklerini siler"""
+        old_dtypes = self.dtypes
+        
+        self.shape = data.shape
+        self.columns = list(data.columns)
+        self.dtypes = data.dtypes.to_dict()
+        self.numeric_columns = list(data.select_dtypes(include=[np.number]).columns)
+        self.categorical_columns = list(data.select_dtypes(include=['object', 'category']).columns)
+        self.estimated_memory_usage = estimate_memory_usage(data)
+        
+        changed = [col for col in set(old_dtypes) | set(self.dtypes)
+                   if old_dtypes.get(col) != self.dtypes.get(col)]
+        self.invalidate(changed)
+        if changed:
+            self._sample = None
+    
+    def invalidate(self, columns: Optional[List[str]] = None):
+        """Verilen sütunların (veya tümünün) önbelleklenmiş istatistiklerini siler"""
+        if columns is None:
+            self._column_stats.clear()
+            return
+        for col in columns:
+            self._column_stats.pop(col, None)
+    
+    def inherit(self, previous: "DataProfile", unchanged: List[str]):
+        """Önceki profilin istatistiklerini devralır; içeriği değişen sütunlarınkiler silinir"""
+        self._column_stats = {col: dict(stats) for col, stats in previous._column_stats.items()
+                              if previous.dtypes.get(col) == self.dtypes.get(col)}
+        self.invalidate([col for col in self._column_stats if col not in unchanged])
+    
+    def has_stat(self, col: str, stat: str) -> bool:
+        return stat in self._column_stats.get(col, {})
+    
+    def set_sample(self, sample: Optional[pd.DataFrame]):
+        """Yükleme sırasında toplanan rezervuar örneklemini profile bağlar"""
+        self._sample = sample
+    
+    def sample(self, size: int = PROFILE_SAMPLE_SIZE) -> pd.DataFrame:
+        """Tekdüze rastgele örneklem döndürür; maliyet tablo boyutundan bağımsızdır"""
+        if self._sample is not None and (len(self._sample) >= size or len(self._sample) == self.shape[0]):
+            if len(self._sample) <= size:
+                return self._sample
+            # Rezervuar sırası rastgele değildir; alt örneklem de rastgele seçilir
+            positions = np.random.default_rng().choice(len(self._sample), size, replace=False)
+            return self._sample.take(np.sort(positions))
+        
+        rows = self.shape[0]
+        if rows <= size:
+            positions = np.arange(rows)
+        else:
+            positions = np.sort(np.random.default_rng().choice(rows, size, replace=False))
+        self._sample = self._row_source(positions)
+        return self._sample
+    
+    def compute_exact(self):
+        """Tüm kesin profil istatistiklerini hesaplar (arka plan işi)"""
+        try:
+            for col in self.columns:
+                check_cancelled()
+                self.null_count(col)
+                self.column_memory(col)
+            logger.info("Kesin profil istatistikleri hesaplandı")
+        finally:
+            self.exact_profile_pending = False
+    
+    def _column_stat(self, col: str, stat: str, compute: Callable[[pd.Series], Any]) -> Any:
+        column_stats = self._column_stats.setdefault(col, {})
+        if stat not in column_stats:
+            column_stats[stat] = compute(self._data_source([col])[col])
+        return column_stats[stat]
+    
+    def null_count(self, col: str) -> int:
+        return self._column_stat(col, 'null_count', lambda values: int(values.isnull().sum()))
+    
+    def column_memory(self, col: str) -> int:
+        return self._column_stat(col, 'memory', lambda values: int(values.memory_usage(deep=True, index=False)))
+    
+    def sketch(self, col: str) -> ColumnSketch:
+        """Sütunun kantil/farklı değer taslağı; ilk ihtiyaçta tek geçişte oluşturulur"""
+        return self._column_stat(col, 'sketch', build_column_sketch)
+    
+    def summaries(self, columns: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Sayısal sütun özetleri (min/max/argmin/argmax/sum/mean/std/çeyrekler); eksikler tek birleşik geçişte hesaplanır"""
+        columns = self.numeric_columns if columns is None else columns
+        pending = [col for col in columns if not self.has_stat(col, 'summary')]
+        if pending:
+            if self._partitions is not None:
+                stats = self._partitions.column_summaries(pending)
+                sketches = self._partitions.column_sketches(pending)
+                self.preset('sketch', sketches)
+                stats = stats.join(pd.DataFrame(
+                    [sketches[col].quantiles.quantiles(list(SKETCH_QUANTILES.values())) for col in pending],
+                    index=pending, columns=list(SKETCH_QUANTILES)))
+            elif self.approximate_quantiles:
+                # Büyük tablolarda çeyrekler tam sıralama yerine kantil taslağından okunur
+                operations = [operation for operation in SUMMARY_STATISTICS if operation not in SKETCH_QUANTILES]
+                stats = parallel_column_statistics(self._data_source(pending), pending, operations)
+                stats = stats.join(pd.DataFrame(
+                    [self.sketch(col).quantiles.quantiles(list(SKETCH_QUANTILES.values())) for col in pending],
+                    index=pending, columns=list(SKETCH_QUANTILES)))
+            else:
+                stats = parallel_column_statistics(self._data_source(pending), pending, SUMMARY_STATISTICS)
+            for col, row in stats.iterrows():
+                self._column_stats.setdefault(col, {})['summary'] = row.to_dict()
+        return {col: self._column_stats[col]['summary'] for col in columns}
+    
+    @property
+    def approximate_quantiles(self) -> bool:
+        """Çeyreklerin taslaktan yaklaşık hesaplanıp hesaplanmayacağı"""
+        return self._partitions is not None or self.shape[0] >= APPROX_QUANTILE_MIN_ROWS
+    
+    def preset(self, stat: str, values: Dict[str, Any]):
+        """Başka bir kaynaktan (ör. parça manifestosu) bilinen sütun istatistiklerini kaydeder"""
+        for col, value in values.items():
+            self._column_stats.setdefault(col, {})[stat] = value
+    
+    @property
+    def null_counts(self) -> Dict[str, int]:
+        return {col: self.null_count(col) for col in self.columns}
+    
+    @property
+    def memory_usage(self) -> int:
+        """Derin (deep) bellek kullanımı - sütun başına bir kez hesaplanır"""
+        return sum(self.column_memory(col) for col in self.columns)
+
+def estimate_memory_usage(data: pd.DataFrame, sample_rows: int = 1000) -> int:
+    """Bellek kullanımını metin sütunları için örneklem üzerinden hızlıca tahmin eder"""
+    usage = int(data.memory_usage(deep=False).sum())
+    if len(data) == 0:
+        return usage
+    
+    object_columns = list(data.select_dtypes(include=['object']).columns)
+    if object_columns:
+        sample = data[object_columns].head(sample_rows)
+        shallow = sample.memory_usage(deep=False, index=False).sum()
+        deep = sample.memory_usage(deep=True, index=False).sum()
+        usage += int((deep - shallow) * len(data) / len(sample))
+    
+    return usage
+
+class ColumnIndex:
+    """Tek sütun için sıralı indeks (aralık sorguları) ve hash indeksi (eşitlik sorguları)"""
+    
+    def __init__(self, values: pd.Series):
+        array = values.to_numpy()
+        valid = np.flatnonzero(values.notna().to_numpy())
+        
+        # Kararlı sıralama: eşit değerlerin satır pozisyonları artan sırada kalır
+        order = valid[np.argsort(array[valid], kind='stable')]
+        self.sorted_values = array[order]
+        self.order = order
+        self._hash: Optional[Dict[Any, Tuple[int, int]]] = None
+    
+    @property
+    def nbytes(self) -> int:
+        return int(self.order.nbytes + self.sorted_values.nbytes)
+    
+    def _hash_index(self) -> Optional[Dict[Any, Tuple[int, int]]]:
+        """Değer -> (başlangıç, bitiş) hash tablosu; ilk eşitlik sorgusunda kurulur"""
+        if self._hash is None and len(self.sorted_values) > 0:
+            starts = np.flatnonzero(np.concatenate(([True], self.sorted_values[1:] != self.sorted_values[:-1])))
+            if len(starts) > HASH_INDEX_MAX_KEYS:
+                return None
+            ends = np.append(starts[1:], len(self.order))
+            self._hash = dict(zip(self.sorted_values[starts].tolist(), zip(starts.tolist(), ends.tolist())))
+        return self._hash
+    
+    def bounds(self, op: str, value: Any) -> List[Tuple[int, int]]:
+        """Koşulu sağlayan sıralı indeks aralıklarını döndürür (satırlar henüz toplanmaz)"""
+        if op in ("==", "in"):
+            values = value if op == "in" else [value]
+            hash_index = self._hash_index()
+            if hash_index is not None:
+                # O(1) hash araması
+                ranges = [hash_index[item] for item in values if item in hash_index]
+            else:
+                ranges = [(int(np.searchsorted(self.sorted_values, item, side='left')),
+                           int(np.searchsorted(self.sorted_values, item, side='right'))) for item in values]
+            # Tekrarlanan değerler (300 ve 300.0 dahil) aynı aralığa düşer; satırlar bir kez döndürülür
+            return list(dict.fromkeys(ranges))
+        
+        # O(log n) aralık araması
+        low, high, include_low, include_high = None, None, True, True
+        if op == "between":
+            low, high = value
+        elif op in (">", ">="):
+            low, include_low = value, op == ">="
+        else:
+            high, include_high = value, op == "<="
+        
+        start = 0 if low is None else int(np.searchsorted(self.sorted_values, low, side='left' if include_low else 'right'))
+        end = len(self.order) if high is None else int(np.searchsorted(self.sorted_values, high, side='right' if include_high else 'left'))
+        return [(start, max(start, end))]
+    
+    def lookup(self, bounds: List[Tuple[int, int]], presorted: bool = False) -> np.ndarray:
+        """Aralıklardaki satır pozisyonlarını artan sırada döndürür"""
+        if len(bounds) == 1 and presorted:
+            # Tek değerli aralıkta pozisyonlar kararlı sıralama sayesinde zaten artan sırada
+            return self.order[bounds[0][0]:bounds[0][1]]
+        parts = [self.order[start:end] for start, end in bounds]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+def format_group_labels(keys: pd.DataFrame) -> List[str]:
+    """Grup anahtarı satırlarını metin etiketlere çevirir"""
+    return [", ".join(str(value) for value in row) for row in keys.itertuples(index=False, name=None)]
+
+class GroupIndex:
+    """Bir anahtar sütun kümesi için gruplama kodları; aynı gruplamadaki tüm agregasyonlarda yeniden kullanılır"""
+    
+    def __init__(self, data: pd.DataFrame, keys: List[str]):
+        combined: Optional[np.ndarray] = None
+        for key in keys:
+            # sort=True: kodlar anahtar sırasını korur, birleşik kod sözlük sırasında olur
+            key_codes, uniques = pd.factorize(data[key], sort=True)
+            key_codes = key_codes.astype(np.int64)
+            if combined is None:
+                combined = key_codes
+                continue
+            
+            missing = (combined < 0) | (key_codes < 0)
+            if combined.max(initial=0) + 1 > np.iinfo(np.int64).max // max(len(uniques), 1):
+                # Taşmayı önlemek için ara kodlar sıkıştırılır (sıra korunur)
+                combined = pd.factorize(combined, sort=True)[0].astype(np.int64)
+            combined = combined * len(uniques) + key_codes
+            combined[missing] = -1
+        
+        # Eksik anahtarlı satırlar (pandas'taki gibi) gruplara dahil edilmez
+        valid = combined >= 0
+        self.rows: Optional[np.ndarray] = None if valid.all() else np.flatnonzero(valid)
+        if self.rows is not None:
+            combined = combined[self.rows]
+        if len(keys) > 1:
+            # Seyrek birleşik kodlar 0..k-1 aralığına sıkıştırılır (hash tabanlı, O(n))
+            combined = pd.factorize(combined, sort=True)[0]
+        
+        self.keys = list(keys)
+        self.codes = combined.astype(np.int16 if combined.max(initial=0) < np.iinfo(np.int16).max else np.intp)
+        self.sizes = np.bincount(self.codes, minlength=0)
+        self.starts = np.concatenate(([0], np.cumsum(self.sizes)[:-1])).astype(np.intp) if len(self.sizes) else np.empty(0, dtype=np.intp)
+        # Her grup için anahtar değerlerinin okunacağı herhangi bir satır
+        key_rows = np.empty(len(self.sizes), dtype=np.intp)
+        key_rows[self.codes] = np.arange(len(self.codes))
+        self.key_rows = key_rows if self.rows is None else self.rows[key_rows]
+        self._order: Optional[np.ndarray] = None
+    
+    @property
+    def ngroups(self) -> int:
+        return len(self.sizes)
+    
+    @property
+    def order(self) -> np.ndarray:
+        """Satırların grup sırasına dizilmiş pozisyonları; yalnızca min/max gibi sıralı indirgemelerde kurulur"""
+        if self._order is None:
+            # Küçük kod uzayında (int16) numpy kararlı sıralamada radix sort kullanır
+            self._order = np.argsort(self.codes, kind='stable')
+        return self._order
+    
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.codes, self.sizes, self.starts, self.key_rows]
+        arrays += [array for array in (self.rows, self._order) if array is not None]
+        return int(sum(array.nbytes for array in arrays))
+    
+    def _bincount(self, weights: np.ndarray) -> np.ndarray:
+        """Grup kodlarıyla ağırlıklı toplam; büyük tablolarda satır blokları paralel sayılıp toplanır"""
+        def count_block(bounds: Tuple[int, int]) -> np.ndarray:
+            start, end = bounds
+            return np.bincount(self.codes[start:end], weights=weights[start:end], minlength=self.ngroups)
+        
+        return np.sum(parallel_map(count_block, row_blocks(len(self.codes))), axis=0)
+    
+    def _reduceat(self, reducer: np.ufunc, array: np.ndarray) -> np.ndarray:
+        """Sıralı düzende grup bazlı indirgeme; büyük tablolarda grup aralıkları paralel işlenir"""
+        def reduce_block(bounds: Tuple[int, int]) -> np.ndarray:
+            first, last = bounds
+            start = int(self.starts[first])
+            end = int(self.starts[last]) if last < self.ngroups else len(self.order)
+            return reducer.reduceat(array[self.order[start:end]], self.starts[first:last] - start)
+        
+        return np.concatenate(parallel_map(reduce_block, row_blocks(self.ngroups, len(self.order))))
+    
+    def labels(self, data: pd.DataFrame, groups: np.ndarray) -> List[str]:
+        """Seçilen grupların anahtar değerlerini metin olarak döndürür"""
+        return format_group_labels(data[self.keys].iloc[self.key_rows[groups]])
+    
+    def aggregate(self, values: pd.Series, function: str) -> np.ndarray:
+        """Sütunu gruplara göre toplar; sonuç grup sırasında dizi olarak döner"""
+        if self.ngroups == 0:
+            return np.empty(0)
+        if self.rows is not None:
+            values = values.iloc[self.rows]
+        
+        kind = values.dtype.kind
+        if kind in "iub" and not values.hasnans:
+            if function == "count":
+                return self.sizes
+            array = values.to_numpy(dtype=np.int64)
+            if function in ("sum", "mean"):
+                # Sınır Python tamsayılarıyla hesaplanır; int64'te abs/çarpım taşabilir
+                bound = max(abs(int(array.min(initial=0))), abs(int(array.max(initial=0))))
+                if bound * len(array) < 2 ** 53:
+                    # Toplam float64 ile tam temsil edilebilir: sıralamasız bincount
+                    sums = self._bincount(array)
+                    return sums.astype(np.int64) if function == "sum" else sums / self.sizes
+                sums = self._reduceat(np.add, array)
+                return sums if function == "sum" else sums / self.sizes
+            return self._reduceat(np.minimum if function == "min" else np.maximum, array)
+        
+        if kind in "iufb":
+            array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~np.isnan(array)
+            if function in ("count", "sum", "mean"):
+                # Toplam ve sayım sıralama gerektirmez: grup kodlarıyla bincount
+                counts = self._bincount(valid)
+                if function == "count":
+                    return counts.astype(np.int64)
+                sums = self._bincount(np.where(valid, array, 0.0))
+                if function == "sum":
+                    return sums
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    return np.where(counts > 0, sums / counts, np.nan)
+            # fmin/fmax NaN değerleri atlar
+            return self._reduceat(np.fmin if function == "min" else np.fmax, array)
+        
+        if function in ("sum", "mean"):
+            raise TypeError(f"'{values.name}' sayısal bir sütun değil")
+        # Sayısal olmayan değerler sıralı kodlara çevrilip tam sayı olarak indirgenir
+        value_codes, uniques = pd.factorize(values, sort=True)
+        if function == "count":
+            return self._bincount(value_codes >= 0).astype(np.int64)
+        if function == "min":
+            value_codes = np.where(value_codes < 0, len(uniques), value_codes)
+            reduced = self._reduceat(np.minimum, value_codes)
+            missing = reduced == len(uniques)
+        else:
+            reduced = self._reduceat(np.maximum, value_codes)
+            missing = reduced < 0
+        result = np.asarray(uniques, dtype=object)[np.where(missing, 0, reduced)] if len(uniques) else np.empty(self.ngroups, dtype=object)
+        result[missing] = None
+        return result
+
+class ZoneMap:
+    """Sütun bloklarının min/max özeti; aralık koşulunu sağlayamayacak bloklar taranmadan atlanır"""
+    
+    def __init__(self, block_rows: Optional[int], columns: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        # block_rows None ise bloklar değişken boyutlu parçalardır (out-of-core)
+        self.block_rows = block_rows
+        self.columns = columns
+    
+    @staticmethod
+    def supports(dtype: Any) -> bool:
+        """Sayısal ve zaman damgası (numpy) sütunları desteklenir"""
+        return isinstance(dtype, np.dtype) and dtype.kind in "iufM"
+    
+    @classmethod
+    def build(cls, data: pd.DataFrame, block_rows: int = ZONE_MAP_BLOCK_ROWS) -> "ZoneMap":
+        """Her desteklenen sütun için blok min/max değerlerini tek geçişte hesaplar"""
+        starts = np.arange(0, len(data), block_rows)
+        columns = {}
+        for col in data.columns:
+            if len(data) == 0 or not cls.supports(data[col].dtype):
+                continue
+            values = data[col].to_numpy()
+            # fmin/fmax NaN/NaT değerlerini atlar; tamamen boş blok NaN kalır ve hiçbir aralıkla eşleşmez
+            columns[col] = (np.fmin.reduceat(values, starts), np.fmax.reduceat(values, starts))
+        return cls(block_rows, columns)
+    
+    @property
+    def nbytes(self) -> int:
+        return int(sum(mins.nbytes + maxs.nbytes for mins, maxs in self.columns.values()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        columns = {}
+        for col, (mins, maxs) in self.columns.items():
+            # Zaman damgaları tam sayı olarak saklanır; tam sayılar float'a çevrilmez (kesinlik kaybı budamayı bozar)
+            encode = (lambda values: values.view(np.int64).tolist()) if mins.dtype.kind == "M" else (lambda values: values.tolist())
+            columns[col] = {'dtype': str(mins.dtype), 'min': encode(mins), 'max': encode(maxs)}
+        return {'block_rows': self.block_rows, 'columns': columns}
+    
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "ZoneMap":
+        columns = {}
+        for col, zone in state['columns'].items():
+            dtype = np.dtype(zone['dtype'])
+            if dtype.kind == "M":
+                columns[col] = (np.array(zone['min'], dtype=np.int64).view(dtype),
+                                np.array(zone['max'], dtype=np.int64).view(dtype))
+            else:
+                columns[col] = (np.array(zone['min'], dtype=dtype), np.array(zone['max'], dtype=dtype))
+        return cls(state['block_rows'], columns)
+    
+    def candidates(self, expression: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Koşulu sağlayabilecek blokların maskesi; budama yapılamıyorsa None"""
+        if "and" in expression:
+            masks = [mask for mask in (self.candidates(child) for child in expression["and"]) if mask is not None]
+            return np.logical_and.reduce(masks) if masks else None
+        if "or" in expression:
+            masks = [self.candidates(child) for child in expression["or"]]
+            return None if any(mask is None for mask in masks) else np.logical_or.reduce(masks)
+        if "column" not in expression or expression["operator"] not in ZONE_MAP_OPERATORS:
+            # NOT, görünüm ve diğer operatörler için blok sınırları bir şey söylemez
+            return None
+        
+        zone = self.columns.get(expression["column"])
+        if zone is None:
+            return None
+        mins, maxs = zone
+        op = expression["operator"]
+        try:
+            if mins.dtype.kind == "M":
+                convert = lambda value: np.datetime64(pd.Timestamp(value))
+            else:
+                convert = lambda value: coerce_filter_value(mins.dtype.kind, value)
+            value = [convert(item) for item in expression["value"]] if op == "between" else convert(expression["value"])
+            
+            with np.errstate(invalid='ignore'):
+                if op == ">":
+                    return maxs > value
+                if op == ">=":
+                    return maxs >= value
+                if op == "<":
+                    return mins < value
+                if op == "<=":
+                    return mins <= value
+                if op == "==":
+                    return (mins <= value) & (maxs >= value)
+                return (maxs >= value[0]) & (mins <= value[1])
+        except (TypeError, ValueError):
+            # Karşılaştırılamayan değerde budama yapılmaz; hata filtre değerlendirmesinde raporlanır
+            return None
+
+BITMAP_CONTAINER_ROWS = 1 << 16
+BITMAP_ARRAY_MAX = 4096  # Bu sayıdan fazla eleman içeren blok bitset (8 KB) olarak tutulur
+
+class SelectionBitmap:
+    """Roaring tarzı sıkıştırılmış satır seçimi: 2^16 satırlık bloklar seyrekse sıralı uint16 dizi, yoğunsa bitset"""
+    
+    def __init__(self, rows: int, containers: Dict[int, np.ndarray]):
+        self.rows = rows
+        # Blok no -> uint16 dizi (seyrek) veya 1024 x uint64 bitset (yoğun); boş bloklar tutulmaz
+        self.containers = containers
+    
+    @staticmethod
+    def _pack(mask: np.ndarray) -> np.ndarray:
+        return np.packbits(mask, bitorder='little').view(np.uint64)
+    
+    @staticmethod
+    def _unpack(words: np.ndarray) -> np.ndarray:
+        return np.unpackbits(words.view(np.uint8), bitorder='little').view(bool)
+    
+    @classmethod
+    def _container(cls, low: np.ndarray) -> np.ndarray:
+        """Blok içi sıralı pozisyonlardan uygun (dizi veya bitset) konteyneri üretir"""
+        if len(low) <= BITMAP_ARRAY_MAX:
+            return low.astype(np.uint16)
+        mask = np.zeros(BITMAP_CONTAINER_ROWS, dtype=bool)
+        mask[low] = True
+        return cls._pack(mask)
+    
+    @classmethod
+    def _values(cls, container: np.ndarray) -> np.ndarray:
+        if container.dtype == np.uint16:
+            return container
+        return np.flatnonzero(cls._unpack(container)).astype(np.uint16)
+    
+    @classmethod
+    def _words(cls, container: np.ndarray) -> np.ndarray:
+        if container.dtype == np.uint64:
+            return container
+        mask = np.zeros(BITMAP_CONTAINER_ROWS, dtype=bool)
+        mask[container] = True
+        return cls._pack(mask)
+    
+    @staticmethod
+    def _test(words: np.ndarray, low: np.ndarray) -> np.ndarray:
+        low = low.astype(np.uint64)
+        return ((words[low >> np.uint64(6)] >> (low & np.uint64(63))) & np.uint64(1)).astype(bool)
+    
+    @classmethod
+    def _shrink(cls, words: np.ndarray) -> Optional[np.ndarray]:
+        """Bitset sonucunu küçükse diziye çevirir; boşsa None döner"""
+        values = np.flatnonzero(cls._unpack(words))
+        if len(values) == 0:
+            return None
+        return values.astype(np.uint16) if len(values) <= BITMAP_ARRAY_MAX else words
+    
+    @classmethod
+    def from_positions(cls, positions: np.ndarray, rows: int) -> "SelectionBitmap":
+        """Artan sıralı satır pozisyonlarından bitmap oluşturur"""
+        positions = np.asarray(positions, dtype=np.int64)
+        keys = positions >> 16
+        splits = np.flatnonzero(np.diff(keys)) + 1
+        containers = {}
+        for chunk in np.split(positions, splits) if len(positions) else []:
+            containers[int(chunk[0] >> 16)] = cls._container(chunk & 0xFFFF)
+        return cls(rows, containers)
+    
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "SelectionBitmap":
+        """Boolean maskeden bitmap oluşturur; bloklar tek geçişte sayılır"""
+        rows = len(mask)
+        blocks = -(-rows // BITMAP_CONTAINER_ROWS)
+        counts = np.add.reduceat(mask, np.arange(0, rows, BITMAP_CONTAINER_ROWS), dtype=np.int64) if rows else np.empty(0)
+        containers = {}
+        for key in np.flatnonzero(counts[:blocks]):
+            block = mask[key * BITMAP_CONTAINER_ROWS:(key + 1) * BITMAP_CONTAINER_ROWS]
+            if counts[key] <= BITMAP_ARRAY_MAX:
+                containers[int(key)] = np.flatnonzero(block).astype(np.uint16)
+            else:
+                full = np.zeros(BITMAP_CONTAINER_ROWS, dtype=bool)
+                full[:len(block)] = block
+                containers[int(key)] = cls._pack(full)
+        return cls(rows, containers)
+    
+    def positions(self) -> np.ndarray:
+        """Seçili satır pozisyonlarını artan sırada döndürür"""
+        parts = [(key << 16) + self._values(container).astype(np.int64)
+                 for key, container in sorted(self.containers.items())]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    
+    def head(self, n: int) -> np.ndarray:
+        """İlk n pozisyon; yalnızca gereken bloklar açılır"""
+        parts: List[np.ndarray] = []
+        remaining = n
+        for key, container in sorted(self.containers.items()):
+            if remaining <= 0:
+                break
+            values = (key << 16) + self._values(container)[:remaining].astype(np.int64)
+            parts.append(values)
+            remaining -= len(values)
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    
+    def count(self) -> int:
+        return int(sum(len(container) if container.dtype == np.uint16 else np.count_nonzero(self._unpack(container))
+                       for container in self.containers.values()))
+    
+    @property
+    def nbytes(self) -> int:
+        return int(sum(container.nbytes for container in self.containers.values()))
+    
+    def contains(self, positions: np.ndarray) -> np.ndarray:
+        """Artan sıralı pozisyonların seçimde olup olmadığını döndürür"""
+        positions = np.asarray(positions, dtype=np.int64)
+        result = np.zeros(len(positions), dtype=bool)
+        keys = positions >> 16
+        bounds = np.searchsorted(keys, np.arange(keys[-1] + 2)) if len(positions) else []
+        for key, container in self.containers.items():
+            if key + 1 >= len(bounds):
+                continue
+            start, end = bounds[key], bounds[key + 1]
+            if start == end:
+                continue
+            low = (positions[start:end] & 0xFFFF).astype(np.uint16)
+            if container.dtype == np.uint16:
+                found = np.minimum(np.searchsorted(container, low), len(container) - 1)
+                result[start:end] = container[found] == low
+            else:
+                result[start:end] = self._test(container, low)
+        return result
+    
+    def __and__(self, other: "SelectionBitmap") -> "SelectionBitmap":
+        containers = {}
+        for key in self.containers.keys() & other.containers.keys():
+            left, right = self.containers[key], other.containers[key]
+            if left.dtype == np.uint16 and right.dtype == np.uint16:
+                merged = np.intersect1d(left, right, assume_unique=True)
+            elif left.dtype == np.uint16 or right.dtype == np.uint16:
+                values, words = (left, right) if left.dtype == np.uint16 else (right, left)
+                merged = values[self._test(words, values)]
+            else:
+                merged = self._shrink(left & right)
+            if merged is not None and len(merged):
+                containers[key] = merged
+        return SelectionBitmap(self.rows, containers)
+    
+    def __or__(self, other: "SelectionBitmap") -> "SelectionBitmap":
+        containers = dict(self.containers)
+        for key, right in other.containers.items():
+            left = containers.get(key)
+            if left is None:
+                containers[key] = right
+            elif left.dtype == np.uint16 and right.dtype == np.uint16:
+                merged = np.union1d(left, right)
+                containers[key] = merged if len(merged) <= BITMAP_ARRAY_MAX else self._words(merged)
+            else:
+                containers[key] = self._words(left) | self._words(right)
+        return SelectionBitmap(self.rows, containers)
+    
+    def __invert__(self) -> "SelectionBitmap":
+        containers = {}
+        full = np.full(BITMAP_CONTAINER_ROWS // 64, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for key in range(-(-self.rows // BITMAP_CONTAINER_ROWS)):
+            container = self.containers.get(key)
+            words = full.copy() if container is None else ~self._words(container)
+            tail = self.rows - key * BITMAP_CONTAINER_ROWS
+            if tail < BITMAP_CONTAINER_ROWS:
+                # Son blokta tablo dışındaki bitler temizlenir
+                mask = self._unpack(words).copy()
+                mask[tail:] = False
+                words = self._pack(mask)
+            merged = self._shrink(words)
+            if merged is not None:
+                containers[key] = merged
+        return SelectionBitmap(self.rows, containers)
+
+class PartitionedDataset:
+    """Disk üzerindeki Arrow IPC parçaları (out-of-core); veri belleğe alınmadan parça parça taranır"""
+    
+    def __init__(self, directory: str, manifest: Dict[str, Any]):
+        self.directory = directory
+        self.files: List[str] = manifest['files']
+        self.part_rows: List[int] = manifest['rows']
+        self.null_counts: Dict[str, int] = manifest['null_counts']
+        self.column_bytes: Dict[str, int] = manifest['column_bytes']
+        self.part_starts = np.concatenate(([0], np.cumsum(self.part_rows))).astype(np.int64)
+        self.schema = self.read_part(0).head(0)
+        # Parça bazında min/max; eski manifestolarda bulunmaz
+        self.zone_map = ZoneMap.from_dict(manifest['zones']) if manifest.get('zones') else None
+        self.sketches: Dict[str, ColumnSketch] = {}
+        sketch_path = os.path.join(directory, "sketches.json")
+        if os.path.exists(sketch_path):
+            with open(sketch_path, 'r', encoding='utf-8') as handle:
+                self.sketches = {col: ColumnSketch.from_dict(state) for col, state in json.load(handle).items()}
+    
+    @property
+    def rows(self) -> int:
+        return int(self.part_starts[-1])
+    
+    @property
+    def nbytes(self) -> int:
+        return int(sum(self.column_bytes.values()))
+    
+    @classmethod
+    def open(cls, directory: str) -> Optional["PartitionedDataset"]:
+        """Manifestosu tamamlanmış parça dizinini açar"""
+        manifest_path = os.path.join(directory, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as handle:
+            return cls(directory, json.load(handle))
+    
+    def read_part(self, index: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Tek parçayı memory-map ile okur; yalnızca istenen sütunların sayfalarına dokunulur"""
+        with pa.memory_map(os.path.join(self.directory, self.files[index]), 'r') as source:
+            table = pa_ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas(split_blocks=True)
+    
+    def scan(self, columns: Optional[List[str]] = None, parts: Optional[Sequence[int]] = None):
+        """Parçaları (verilirse yalnızca seçilenleri) sırayla (parça no, DataFrame) olarak üretir"""
+        for index in range(len(self.files)) if parts is None else parts:
+            check_cancelled()
+            yield index, self.read_part(index, columns)
+    
+    def map_parts(self, func: Callable[[pd.DataFrame], Any], columns: Optional[List[str]] = None):
+        """Her parçaya func uygular; parçalar hesaplama havuzunda paralel okunup işlenir, sonuçlar sırayla üretilir"""
+        def run(index: int) -> Any:
+            check_cancelled()
+            return func(self.read_part(index, columns))
+        
+        batch = max(PARALLEL_WORKERS, 1)
+        for first in range(0, len(self.files), batch):
+            yield from parallel_map(run, range(first, min(first + batch, len(self.files))))
+    
+    def column_sketches(self, columns: List[str]) -> Dict[str, ColumnSketch]:
+        """Sütun taslakları; yazma sırasında kaydedilmemiş olanlar parça taslakları birleştirilerek oluşturulur"""
+        pending = [col for col in columns if col not in self.sketches]
+        if pending:
+            def part_sketches(part: pd.DataFrame) -> Dict[str, ColumnSketch]:
+                return {col: build_column_sketch(part[col]) for col in pending}
+            
+            for partial in self.map_parts(part_sketches, pending):
+                for col, sketch in partial.items():
+                    if col in self.sketches:
+                        self.sketches[col].merge(sketch)
+                    else:
+                        self.sketches[col] = sketch
+        return {col: self.sketches[col] for col in columns}
+    
+    def column_summaries(self, columns: List[str]) -> pd.DataFrame:
+        """Sayısal sütun özetlerini parça kısmi sonuçlarından birleştirir; argmin/argmax genel satır pozisyonudur"""
+        def part_statistics(part: pd.DataFrame) -> pd.DataFrame:
+            return compute_column_statistics(part, columns, MERGEABLE_STATISTICS + ["argmin", "argmax"])
+        
+        merged = None
+        positions: Dict[str, pd.Series] = {}
+        for index, partial in enumerate(self.map_parts(part_statistics, columns)):
+            found = partial["count"] > 0
+            offset = float(self.part_starts[index])
+            for name, bound in (("argmin", "min"), ("argmax", "max")):
+                position = (partial[name] + offset).where(found, -1.0)
+                if merged is not None:
+                    # Eşit değerlerde önceki parçadaki ilk satır korunur
+                    better = partial[bound] < merged[bound] if bound == "min" else partial[bound] > merged[bound]
+                    position = position.where(found & (better | merged[bound].isna()), positions[name])
+                positions[name] = position
+            merged = merge_statistics_partials(merged, partial[MERGEABLE_STATISTICS])
+        
+        merged = finalize_statistics_partials(merged)
+        for name, position in positions.items():
+            merged[name] = position
+        return merged
+    
+    def take(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Artan sıralı satır pozisyonlarını yalnızca içeren parçalardan okur"""
+        bounds = np.searchsorted(positions, self.part_starts)
+        frames = []
+        for index in range(len(self.files)):
+            if bounds[index] == bounds[index + 1]:
+                continue
+            local = positions[bounds[index]:bounds[index + 1]] - self.part_starts[index]
+            frames.append(self.read_part(index, columns).take(local))
+        if not frames:
+            return self.schema if columns is None else self.schema[columns]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    
+    def read_rows(self, offset: int, limit: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """[offset, offset + limit) satırlarını yalnızca kesişen parçalardan okur"""
+        end = min(offset + limit, self.rows)
+        frames = []
+        first = max(int(np.searchsorted(self.part_starts, offset, side='right')) - 1, 0)
+        for index in range(first, len(self.files)):
+            start = int(self.part_starts[index])
+            if start >= end:
+                break
+            part = self.read_part(index, columns)
+            frames.append(part.iloc[max(offset - start, 0):end - start])
+        if not frames:
+            return self.schema if columns is None else self.schema[columns]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+class DatasetEntry:
+    """Kayıt defterindeki isimli veri seti"""
+    
+    def __init__(self, name: str, data: Optional[pd.DataFrame], source: Dict[str, Any], load_info: Dict[str, Any],
+                 partitions: Optional[PartitionedDataset] = None):
+        self.name = name
+        self.source = source
+        self.load_info = load_info
+        self.version = next(_dataset_versions)
+        # Önbelleğe yazılmış veri seti için ayrıca diske taşıma gerekmez
+        self.spill_key: Optional[str] = load_info.get('cache_key')
+        self._data: Optional[pd.DataFrame] = data
+        self.partitions = partitions
+        self.info = DataProfile(data if partitions is None else partitions.schema, self.frame, partitions, self.take)
+        if partitions is not None:
+            # Profil şeması ilk parçadan, sayımlar yazma sırasında tutulan manifestodan gelir
+            self.info.shape = (partitions.rows, len(partitions.schema.columns))
+            self.info.estimated_memory_usage = 0
+            self.info.preset('null_count', partitions.null_counts)
+            self.info.preset('memory', partitions.column_bytes)
+            self.info.preset('sketch', partitions.sketches)
+        self.indexes: Dict[str, Optional[ColumnIndex]] = {}
+        self._index_lookups: Dict[str, int] = {}
+        self.string_views: Dict[str, Any] = {}
+        self.groupings: Dict[Tuple[str, ...], GroupIndex] = {}
+        # arrow_mmap depolamada sütunların baktığı memory-mapped Arrow tablosu
+        self.arrow_table: Any = None
+        # Yüklemede kaydedilen blok min/max özeti; veri değişmediği sürece bellekten çıkarmada korunur
+        self.zone_map: Optional[ZoneMap] = None
+    
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None or self.partitions is not None
+    
+    @property
+    def memory_bytes(self) -> int:
+        if not self.loaded:
+            # Bellekten çıkarılmış veri setinin profili kalır ama bellekte yer tutmaz
+            return 0
+        index_bytes = sum(index.nbytes for index in self.indexes.values() if index is not None)
+        view_bytes = sum(view.nbytes for view in self.string_views.values())
+        grouping_bytes = sum(grouping.nbytes for grouping in self.groupings.values())
+        return self.info.estimated_memory_usage + index_bytes + view_bytes + grouping_bytes
+    
+    @property
+    def disk_bytes(self) -> int:
+        """Bellekten çıkarılmış verinin diskteki Arrow dosyasının boyutu"""
+        if self.spill_key is None:
+            return 0
+        try:
+            return os.path.getsize(cache_file_path(self.spill_key))
+        except OSError:
+            return 0
+    
+    def string_view(self, column: str) -> Any:
+        """Sütunun metin görünümünü (Arrow string dizisi, yoksa str Series) bir kez oluşturup saklar"""
+        view = self.string_views.get(column)
+        if view is None:
+            view = build_string_view(self.frame([column])[column])
+            self.string_views[column] = view
+        return view
+    
+    def index_for(self, column: str) -> Optional[ColumnIndex]:
+        """Sütun indeksini döndürür; sık sorgulanan sütunlar için ilk ihtiyaçta oluşturur"""
+        if column in self.indexes:
+            return self.indexes[column]
+        
+        lookups = self._index_lookups.get(column, 0) + 1
+        self._index_lookups[column] = lookups
+        if lookups < INDEX_MIN_LOOKUPS:
+            return None
+        
+        values = self.frame([column])[column]
+        index = None
+        if values.dtype.kind in "iufbO" or pd.api.types.is_string_dtype(values.dtype):
+            try:
+                index = ColumnIndex(values)
+                logger.info(f"İndeks oluşturuldu: {self.name}.{column}")
+            except TypeError:
+                # Karışık tipli sütunlar sıralanamaz; tam tarama kullanılır
+                index = None
+        self.indexes[column] = index
+        return index
+    
+    def grouping(self, keys: List[str]) -> GroupIndex:
+        """Anahtar kümesinin grup kodlarını döndürür; ilk kullanımda hesaplanıp saklanır"""
+        key = tuple(keys)
+        grouping = self.groupings.get(key)
+        if grouping is None:
+            grouping = GroupIndex(self.frame(keys), keys)
+            self.groupings[key] = grouping
+        return grouping
+    
+    def unchanged_columns(self, previous: "DatasetEntry") -> List[str]:
+        """Aynı isimle yeniden yüklenen veri setinde içeriği önceki yüklemeyle aynı kalan sütunlar"""
+        if self.partitions is not None or previous.partitions is not None or isinstance(previous, DatasetView):
+            return []
+        # Aynı dosya içeriği ve seçeneklerle yükleme: parmak izi aynıysa hiçbir sütun değişmemiştir
+        cache_key = self.load_info.get('cache_key')
+        if cache_key is not None and cache_key == previous.load_info.get('cache_key'):
+            return list(self.info.columns)
+        if previous._data is None or self._data is None:
+            return []
+        return [col for col in self.info.columns
+                if col in previous._data.columns and previous._data[col].equals(self._data[col])]
+    
+    def replace_data(self, data: pd.DataFrame, changed: Optional[List[str]] = None):
+        """Veriyi değiştirir; profilde yalnızca değişen sütunların (None ise tümünün) istatistikleri silinir"""
+        self._data = data
+        self.info.update_schema(data)
+        self.info.invalidate(changed)
+        self.version = next(_dataset_versions)
+        self.indexes.clear()
+        self.string_views.clear()
+        self.groupings.clear()
+        result_cache.invalidate(self.name)
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        if self.partitions is not None:
+            raise ValueError(f"'{self.name}' disk üzerinde parça parça işlenen (out-of-core) bir veri seti; "
+                             f"bu işlem için filter_data, calculate_statistics veya group_analysis kullanın")
+        if self._data is None:
+            self._data = restore_dataset(self)
+        return self._data
+    
+    def frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Veriyi (verilirse yalnızca istenen sütunlarla) döndürür"""
+        return self.data if columns is None else self.data[columns]
+    
+    def take(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Verilen satır pozisyonlarını döndürür"""
+        if self.partitions is not None:
+            return self.partitions.take(positions, columns)
+        return self.frame(columns).iloc[positions]
+    
+    def evict(self) -> bool:
+        """Veriyi diske taşıyıp bellekten çıkarır"""
+        if self.partitions is not None:
+            # Out-of-core veri zaten diskte; bellekte yalnızca örneklem tutulur
+            return False
+        if self._data is None:
+            return True
+        
+        if self.spill_key is None and cache_available():
+            spill_key = hashlib.sha256(f"spill:{self.name}:{self.version}".encode('utf-8')).hexdigest()
+            if write_cached_dataset(spill_key, self._data):
+                self.spill_key = spill_key
+        
+        if self.spill_key is None:
+            return False
+        
+        self._data = None
+        self.arrow_table = None
+        self.indexes.clear()
+        self.string_views.clear()
+        self.groupings.clear()
+        logger.info(f"Veri seti bellekten çıkarıldı: {self.name}")
+        return True
+
+class DatasetView(DatasetEntry):
+    """Temel veri seti üzerinde kaydedilmiş filtre sonucu; satırlar kopyalanmaz, sıkıştırılmış seçim bitmap'i tutulur"""
+    
+    def __init__(self, name: str, base: DatasetEntry, selection: SelectionBitmap, expression: Dict[str, Any]):
+        # Görünümün görünümü de doğrudan kök veri setine bağlanır
+        if isinstance(base, DatasetView):
+            selection = SelectionBitmap.from_positions(base.selection[selection.positions()], base.base.info.shape[0])
+            expression = {"and": [base.expression, expression]}
+            base = base.base
+        self.base = base
+        self.bitmap = selection
+        self.expression = expression
+        # Pozisyon dizisi ve sütunlar ilk ihtiyaçta yalnızca seçili satırlar için açılır
+        self._positions: Optional[np.ndarray] = None
+        self._columns: Dict[str, pd.Series] = {}
+        schema = base.partitions.schema if base.partitions is not None else base.data.head(0)
+        super().__init__(name, schema, {'view_of': base.name, 'expression': expression},
+                         {'mode': 'view', 'base': base.name, 'filter': describe_filter(expression)})
+        # Profil şeması boş çerçeveden kuruldu; veri kaynağı seçim vektörüdür
+        self._data = None
+        self.info.shape = (selection.count(), len(schema.columns))
+        self.info.estimated_memory_usage = 0
+    
+    @property
+    def loaded(self) -> bool:
+        return True
+    
+    @property
+    def selection(self) -> np.ndarray:
+        """Kök veri setindeki artan sıralı satır pozisyonları"""
+        if self._positions is None:
+            self._positions = self.bitmap.positions()
+        return self._positions
+    
+    @property
+    def memory_bytes(self) -> int:
+        gathered = sum(int(values.memory_usage(index=False)) for values in self._columns.values())
+        positions = self._positions.nbytes if self._positions is not None else 0
+        return super().memory_bytes + self.bitmap.nbytes + positions + gathered
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        return self.frame()
+    
+    def frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Seçili satırları yalnızca istenen sütunlar için toplar; toplanan sütunlar saklanır"""
+        columns = self.info.columns if columns is None else columns
+        missing = [col for col in columns if col not in self._columns]
+        if missing:
+            gathered = self.base.take(self.selection, missing).reset_index(drop=True)
+            for col in missing:
+                self._columns[col] = gathered[col]
+        if not columns:
+            return pd.DataFrame(index=pd.RangeIndex(self.info.shape[0]))
+        return pd.concat([self._columns[col] for col in columns], axis=1)
+    
+    def take(self, positions: np.ndarray, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Görünüm satırlarını temel veri setinden doğrudan okur; sütunların tamamı toplanmaz"""
+        if all(col in self._columns for col in (self.info.columns if columns is None else columns)):
+            return self.frame(columns).iloc[positions]
+        return self.base.take(self.selection[positions], columns).reset_index(drop=True)
+    
+    def evict(self) -> bool:
+        """Toplanmış sütunları ve açılmış pozisyonları bırakır; sıkıştırılmış seçim bellekte kalır"""
+        self._positions = None
+        self._columns.clear()
+        self.indexes.clear()
+        self.string_views.clear()
+        self.groupings.clear()
+        return True
+
+class DatasetRegistry:
+    """İsimli veri setlerini LRU bellek bütçesiyle yönetir"""
+    
+    def __init__(self, memory_budget_mb: float):
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.entries: "OrderedDict[str, DatasetEntry]" = OrderedDict()
+        self.active: Optional[str] = None
+        self.lock = threading.RLock()
+    
+    def register(self, entry: DatasetEntry, activate: bool = True):
+        """Veri setini ekler (aynı isimde varsa değiştirir) ve istenirse aktif yapar"""
+        with self.lock:
+            previous = self.entries.pop(entry.name, None)
+            if previous is not None and not isinstance(entry, DatasetView):
+                # Yeniden yüklemede değişmeyen sütunların profil istatistikleri yeniden hesaplanmaz
+                entry.info.inherit(previous.info, entry.unchanged_columns(previous))
+            # Değiştirilen veri setinin seçim vektörleri artık geçersizdir
+            for view in [other for other in self.entries.values()
+                         if isinstance(other, DatasetView) and other.base.name == entry.name]:
+                del self.entries[view.name]
+                result_cache.invalidate(view.name)
+                if self.active == view.name:
+                    self.active = None
+            self.entries[entry.name] = entry
+            # Aynı isimle yeniden yüklenen veri setinin eski sonuçları geçersizdir
+            result_cache.invalidate(entry.name)
+            if activate or self.active is None:
+                self.active = entry.name
+            self.enforce_budget(keep=entry.name)
+    
+    def get(self, name: Optional[str] = None) -> Optional[DatasetEntry]:
+        """Veri setini döndürür; isim yoksa aktif veri seti kullanılır"""
+        with self.lock:
+            name = name or self.active
+            entry = self.entries.get(name) if name else None
+            if entry is None:
+                return None
+            
+            self.entries.move_to_end(name)
+            if not entry.loaded:
+                entry.data
+                self.enforce_budget(keep=name)
+            return entry
+    
+    def enforce_budget(self, keep: Optional[str] = None):
+        """Bütçe aşılırsa en az kullanılan veri setlerini diske taşır"""
+        # Çağıranlar kilidi tutar (RLock)
+        used = sum(entry.memory_bytes for entry in self.entries.values() if entry.loaded)
+        
+        for name, entry in list(self.entries.items()):
+            if used <= self.memory_budget:
+                break
+            if name == keep or not entry.loaded:
+                continue
+            resident = entry.memory_bytes
+            if entry.evict():
+                # Görünümler sıkıştırılmış seçimi bellekte tuttuğu için yalnızca bırakılan kısım düşülür
+                used -= resident - entry.memory_bytes
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+
+class ResultCache:
+    """Araç sonuçları için boyut sınırlı LRU önbellek"""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, int, str, str], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def key(dataset: DatasetEntry, tool: str, arguments: Dict[str, Any]) -> Tuple[str, int, str, str]:
+        """(veri seti, sürüm, araç, normalize edilmiş argümanlar) anahtarı"""
+        # Veri seti adı anahtarda ayrıca yer alır; boş argümanlar varsayılanla aynı sonucu verir
+        normalized = {name: value for name, value in arguments.items() if name != "dataset" and value is not None}
+        return (dataset.name, dataset.version, tool, json.dumps(normalized, sort_keys=True, default=str))
+    
+    def get(self, key: Tuple[str, int, str, str]) -> Optional[str]:
+        with self.lock:
+            result = self.entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return result
+    
+    def put(self, key: Tuple[str, int, str, str], result: str):
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def invalidate(self, dataset_name: str):
+        """Veri setine ait tüm sonuçları siler (yeniden yüklemede çağrılır)"""
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == dataset_name]:
+                del self.entries[key]
+    
+    def summary(self) -> str:
+        """Önbellek istatistikleri"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            hit_rate = self.hits / lookups * 100 if lookups else 0.0
+            return (f"Sonuç önbelleği: {len(self.entries)}/{self.max_entries} kayıt, "
+                    f"{self.hits} isabet, {self.misses} ıskalama (%{hit_rate:.1f} isabet oranı)")
+
+result_cache = ResultCache(RESULT_CACHE_SIZE)
+registry = DatasetRegistry(DATASET_MEMORY_BUDGET_MB)
 
 # MCP Server oluştur
 server = Server("data-analysis-agent")
 
+PAGINATION_HINT = "Sayfalama: ?offset=0&limit=1000&columns=a,b&format=json|ndjson|arrow"
+
 @server.list_resources()
 async def handle_list_resources() -> List[Resource]:
     """Mevcut kaynakları listele"""
     resources = []
     
-    if current_data is not None:
+    if registry.active is not None:
         resources.append(
             Resource(
                 uri=AnyUrl("data://current-dataset"),
                 name="Current Dataset",
-                description="Şu anda yüklü olan veri seti",
+                description=f"Şu anda yüklü olan veri seti. {PAGINATION_HINT}",
                 mimeType="application/json"
             )
         )
@@ -61,6 +1539,25 @@ async def handle_list_resources() -> List[Resource]:
             )
         )
     
+    resources.append(
+        Resource(
+            uri=AnyUrl("data://result-cache"),
+            name="Result Cache",
+            description="Araç sonuç önbelleği isabet/ıskalama istatistikleri",
+            mimeType="text/plain"
+        )
+    )
+    
+    for dataset_name in registry.entries:
+        resources.append(
+            Resource(
+                uri=AnyUrl(f"data://datasets/{quote(dataset_name, safe='')}"),
+                name=f"Dataset: {dataset_name}",
+                description=f"'{dataset_name}' isimli veri seti. {PAGINATION_HINT}",
+                mimeType="application/json"
+            )
+        )
+    
     return resources
 
 @server.read_resource()
@@ -69,29 +1566,102 @@ async def handle_read_resource(uri: AnyUrl) -> str:
     if uri.scheme != "data":
         raise ValueError(f"Desteklenmeyen URI şeması: {uri.scheme}")
     
-    if str(uri) == "data://current-dataset":
-        if current_data is None:
+    return await run_in_worker(read_resource_content, str(uri))
+
+def read_resource_content(uri: str) -> str:
+    """Kaynak içeriğini üretir (worker thread'de çalışır)"""
+    parts = urlsplit(uri)
+    location = parts.netloc + parts.path
+    params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    
+    if location == "current-dataset":
+        dataset = registry.get()
+        if dataset is None:
             raise ValueError("Henüz veri yüklenmedi")
-        return current_data.to_json(orient="records", indent=2)
+        return render_dataset_page(dataset, params)
     
-    elif str(uri) == "data://data-summary":
-        if current_data is None:
+    elif location == "data-summary":
+        dataset = registry.get()
+        if dataset is None:
             raise ValueError("Henüz veri yüklenmedi")
-        return generate_data_summary()
+        return generate_data_summary(dataset)
+    
+    elif location == "result-cache":
+        return result_cache.summary()
+    
+    elif location.startswith("datasets/"):
+        # Boşluk, "/" veya "?" içeren isimler URI'de yüzde kodlanmış gelir
+        dataset_name = unquote(location[len("datasets/"):])
+        dataset = registry.get(dataset_name)
+        if dataset is None:
+            raise ValueError(f"Bilinmeyen veri seti: {dataset_name}")
+        return render_dataset_page(dataset, params)
     
     else:
         raise ValueError(f"Bilinmeyen kaynak: {uri}")
 
+def render_dataset_page(dataset: DatasetEntry, params: Dict[str, str]) -> str:
+    """Veri setinin bir sayfasını istenen formatta serileştirir"""
+    offset = max(int(params.get("offset", 0)), 0)
+    limit = min(max(int(params.get("limit", RESOURCE_PAGE_SIZE)), 0), RESOURCE_MAX_PAGE_SIZE)
+    output_format = params.get("format", "json").lower()
+    
+    if output_format not in RESOURCE_FORMATS:
+        raise ValueError(f"Desteklenmeyen format: {output_format} (desteklenen: {', '.join(RESOURCE_FORMATS)})")
+    
+    columns = None
+    if params.get("columns"):
+        columns = [col.strip() for col in params["columns"].split(",") if col.strip()]
+        missing = [col for col in columns if col not in dataset.info.columns]
+        if missing:
+            raise ValueError(f"Bulunamayan sütunlar: {', '.join(missing)}")
+    
+    # Sadece istenen sayfa dilimlenir; tüm tablo serileştirilmez
+    if dataset.partitions is not None:
+        page = dataset.partitions.read_rows(offset, limit, columns)
+    elif isinstance(dataset, DatasetView):
+        # Görünüm sayfası temel veri setinden yalnızca sayfa satırları için okunur
+        page = dataset.take(np.arange(offset, max(offset, min(offset + limit, dataset.info.shape[0]))), columns)
+    else:
+        page = dataset.frame(columns).iloc[offset:offset + limit]
+    
+    if output_format == "ndjson":
+        buffer = io.StringIO()
+        for start in range(0, len(page), NDJSON_BATCH_ROWS):
+            check_cancelled()
+            lines = page.iloc[start:start + NDJSON_BATCH_ROWS].to_json(orient="records", lines=True, date_format="iso")
+            buffer.write(lines if lines.endswith("\n") else lines + "\n")
+        return buffer.getvalue()
+    
+    if output_format == "arrow":
+        if pa is None:
+            raise ValueError("Arrow formatı için pyarrow kurulu olmalı")
+        if dataset.arrow_table is not None:
+            # Memory-mapped tablo doğrudan dilimlenir (kopyasız)
+            table = dataset.arrow_table.select(list(page.columns)).slice(offset, limit)
+        else:
+            table = pa.Table.from_pandas(page, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa_ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+    
+    return page.to_json(orient="records", indent=2)
+
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """Mevcut araçları listele"""
     return [
         Tool(
             name="load_data",
-            description="CSV, Excel veya JSON formatında veri dosyası yükler",
+            description="CSV, Excel, JSON veya NDJSON (JSON Lines) formatında veri dosyası yükler",
             inputSchema={
                 "type": "object",
                 "properties": {
+                    "dataset": {
+                        "type": "string",
+                        "description": "Yüklenen veri setine verilecek ad (varsayılan: default)"
+                    },
                     "file_path": {
                         "type": "string",
                         "description": "Yüklenecek dosyanın yolu"
@@ -99,6 +1669,28 @@ async def handle_list_tools() -> List[Tool]:
                     "file_content": {
                         "type": "string",
                         "description": "Dosya içeriği (base64 encoded)"
+                    },
+                    "streaming": {
+                        "type": "boolean",
+                        "description": "Dosyayı parça parça okuyarak sınırlı bellekle yükler (CSV). Belirtilmezse büyük dosyalarda otomatik açılır"
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Streaming modunda parça başına satır sayısı"
+                    },
+                    "use_cache": {
+                        "type": "boolean",
+                        "description": "Değişmemiş dosyalar için kolonlu önbelleği kullan (varsayılan: true)"
+                    },
+                    "storage": {
+                        "type": "string",
+                        "enum": STORAGE_MODES,
+                        "description": "memory: özel bellek kopyası; arrow_mmap: memory-mapped Arrow dosyası üzerinde kopyasız görünümler; out_of_core: RAM'den büyük CSV'ler için diskteki parçaların taranması (varsayılan: DATA_STORAGE)"
+                    },
+                    "compact": {
+                        "type": "boolean",
+                        "description": "Yüklemeden sonra tipleri sıkıştır: sayısal küçültme, tarih ayrıştırma, düşük kardinaliteli metin -> category"
                     }
                 },
                 "required": ["file_path"]
@@ -110,6 +1702,10 @@ async def handle_list_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
+                    "dataset": {
+                        "type": "string",
+                        "description": "Veri seti adı (varsayılan: aktif veri seti)"
+                    },
                     "query": {
                         "type": "string",
                         "description": "Analiz sorusu veya komutu"
@@ -128,7 +1724,26 @@ async def handle_list_tools() -> List[Tool]:
             description="Yüklü verinin genel bilgilerini döndürür",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "dataset": {
+                        "type": "string",
+                        "description": "Veri seti adı (varsayılan: aktif veri seti)"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["exact", "approximate"],
+                        "description": "exact: tam tablo üzerinden kesin istatistikler, approximate: rastgele örneklem üzerinden hata payıyla sabit sürede tahmin"
+                    },
+                    "sample_size": {
+                        "type": "integer",
+                        "minimum": 100,
+                        "description": "Yaklaşık modda örneklem büyüklüğü"
+                    },
+                    "upgrade": {
+                        "type": "boolean",
+                        "description": "Yaklaşık modda kesin istatistikleri arka planda hesaplamaya başla"
+                    }
+                },
                 "additionalProperties": False
             }
         ),
@@ -138,21 +1753,46 @@ async def handle_list_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
+                    "dataset": {
+                        "type": "string",
+                        "description": "Veri seti adı (varsayılan: aktif veri seti)"
+                    },
                     "column": {
                         "type": "string",
                         "description": "Filtrelenecek sütun adı"
                     },
                     "operator": {
                         "type": "string",
-                        "enum": ["==", "!=", ">", "<", ">=", "<=", "contains", "startswith", "endswith"],
+                        "enum": FILTER_OPERATORS,
                         "description": "Filtreleme operatörü"
                     },
                     "value": {
-                        "type": ["string", "number"],
-                        "description": "Filtreleme değeri"
+                        "type": ["string", "number", "array", "null"],
+                        "description": "Filtreleme değeri (in/not_in için liste, between için [alt, üst])"
+                    },
+                    "match_mode": {
+                        "type": "string",
+                        "enum": STRING_MATCH_MODES,
+                        "description": "contains/startswith/endswith için eşleşme modu (varsayılan: literal)"
+                    },
+                    "case_sensitive": {
+                        "type": "boolean",
+                        "description": "Metin eşleşmesi büyük/küçük harfe duyarlı mı (varsayılan: true)"
+                    },
+                    "expression": {
+                        "type": "object",
+                        "description": (
+                            "Birleşik filtre ifadesi. Düğümler: {\"and\": [...]}, {\"or\": [...]}, {\"not\": {...}} "
+                            "veya {\"column\": ..., \"operator\": ..., \"value\": ...} (metin koşullarında match_mode, case_sensitive) "
+                            "veya kayıtlı görünüm için {\"view\": ad}. "
+                            "Verilirse column/operator/value yok sayılır"
+                        )
+                    },
+                    "save_as": {
+                        "type": "string",
+                        "description": "Sonucu bu isimle görünüm olarak kaydeder (kopya değil, satır seçimi); diğer araçlar dataset olarak kullanabilir"
                     }
-                },
-                "required": ["column", "operator", "value"]
+                }
             }
         ),
         Tool(
@@ -161,6 +1801,10 @@ async def handle_list_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
+                    "dataset": {
+                        "type": "string",
+                        "description": "Veri seti adı (varsayılan: aktif veri seti)"
+                    },
                     "columns": {
                         "type": "array",
                         "items": {"type": "string"},
@@ -168,11 +1812,19 @@ async def handle_list_tools() -> List[Tool]:
                     },
                     "operation": {
                         "type": "string",
-                        "enum": ["mean", "median", "sum", "min", "max", "std", "var", "count"],
+                        "enum": STATISTIC_OPERATIONS,
                         "description": "İstatistiksel işlem"
+                    },
+                    "operations": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": STATISTIC_OPERATIONS},
+                        "description": "Tek geçişte hesaplanacak birden fazla işlem (verilirse operation yok sayılır)"
+                    },
+                    "approximate": {
+                        "type": "boolean",
+                        "description": "MEDIAN taslaktan yaklaşık hesaplansın (varsayılan: büyük ve out-of-core tablolarda açık)"
                     }
-                },
-                "required": ["operation"]
+                }
             }
         ),
         Tool(
@@ -181,9 +1833,14 @@ async def handle_list_tools() -> List[Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "group_by": {
+                    "dataset": {
                         "type": "string",
-                        "description": "Gruplama yapılacak sütun"
+                        "description": "Veri seti adı (varsayılan: aktif veri seti)"
+                    },
+                    "group_by": {
+                        "type": ["string", "array"],
+                        "items": {"type": "string"},
+                        "description": "Gruplama yapılacak sütun veya sütun listesi"
                     },
                     "agg_column": {
                         "type": "string",
@@ -191,8 +1848,30 @@ async def handle_list_tools() -> List[Tool]:
                     },
                     "agg_function": {
                         "type": "string",
-                        "enum": ["sum", "mean", "count", "min", "max"],
+                        "enum": GROUP_AGGREGATIONS,
                         "description": "Agregasyon fonksiyonu"
+                    },
+                    "aggregations": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "column": {"type": "string"},
+                                "function": {"type": "string", "enum": GROUP_AGGREGATIONS}
+                            },
+                            "required": ["function"]
+                        },
+                        "description": "Aynı gruplamada hesaplanacak birden fazla agregasyon (verilirse agg_column/agg_function yok sayılır)"
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "İlk agregasyona göre sıralanmış yalnızca N grubu döndürür"
+                    },
+                    "order": {
+                        "type": "string",
+                        "enum": ["desc", "asc"],
+                        "description": "top_n sıralama yönü (varsayılan: desc)"
                     }
                 },
                 "required": ["group_by"]
@@ -203,34 +1882,94 @@ async def handle_list_tools() -> List[Tool]:
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Araç çağrılarını işle"""
-    global current_data, data_info
+    try:
+        return await run_in_worker(execute_cached_tool, name, arguments or {})
+    except asyncio.TimeoutError:
+        logger.warning(f"Araç çağrısı zaman aşımına uğradı: {name}")
+        return [TextContent(
+            type="text",
+            text=f"❌ İşlem {TOOL_TIMEOUT_SECONDS:g} saniyede tamamlanamadı ve iptal edildi."
+        )]
+
+def execute_cached_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Tekrarlanan salt okunur araç çağrılarını sonuç önbelleğinden karşılar"""
+    # Görünüm kaydeden veya görünüme başvuran filtre çağrıları önbellek anahtarıyla ifade edilemez
+    if (name not in CACHEABLE_TOOLS or result_cache.max_entries <= 0 or arguments.get("save_as")
+            or has_view_reference(arguments.get("expression"))):
+        return execute_tool(name, arguments)
+    
+    dataset = registry.get(arguments.get("dataset"))
+    if dataset is None:
+        return execute_tool(name, arguments)
     
+    key = ResultCache.key(dataset, name, arguments)
+    cached = result_cache.get(key)
+    if cached is not None:
+        return [TextContent(type="text", text=cached)]
+    
+    contents = execute_tool(name, arguments)
+    # Hata mesajları önbelleğe alınmaz
+    if len(contents) == 1 and not contents[0].text.lstrip().startswith("❌"):
+        result_cache.put(key, contents[0].text)
+    return contents
+
+def execute_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Araç çağrısını yürütür (worker thread'de çalışır)"""
     try:
         if name == "load_data":
             file_path = arguments.get("file_path", "")
+            dataset_name = arguments.get("dataset") or DEFAULT_DATASET
             
             # Dosya yükleme
             try:
                 file_extension = os.path.splitext(file_path)[1].lower()
+                streaming = arguments.get("streaming")
+                chunk_size = arguments.get("chunk_size") or CHUNK_SIZE
+                use_cache = arguments.get("use_cache", True)
+                compact = arguments.get("compact", COMPACT_ON_LOAD)
+                storage = arguments.get("storage") or DATA_STORAGE
                 
-                if file_extension == '.csv':
-                    current_data = pd.read_csv(file_path)
-                elif file_extension in ['.xlsx', '.xls']:
-                    current_data = pd.read_excel(file_path)
-                elif file_extension == '.json':
-                    current_data = pd.read_json(file_path)
-                else:
+                if file_extension not in SUPPORTED_EXTENSIONS:
                     return [TextContent(
                         type="text",
                         text=f"❌ Desteklenmeyen dosya formatı: {file_extension}"
                     )]
                 
-                # Veri analizi
-                analyze_data_structure()
+                if storage not in STORAGE_MODES:
+                    return [TextContent(
+                        type="text",
+                        text=f"❌ Desteklenmeyen depolama modu: {storage}"
+                    )]
+                
+                if streaming is None:
+                    streaming = should_stream(file_path)
+                
+                partitions = None
+                if storage == "out_of_core":
+                    data = None
+                    partitions, load_info = load_partitioned_dataset(file_path, chunk_size, use_cache)
+                else:
+                    data, load_info = load_dataset_file(file_path, streaming, chunk_size, use_cache, compact, storage)
+                
+                # Profil istatistikleri tembel hesaplanır, yükleme ayrıştırma bitince döner
+                sample = load_info.pop('sample', None)
+                arrow_table = load_info.pop('arrow_table', None)
+                zone_map = load_info.pop('zone_map', None)
+                dataset = DatasetEntry(dataset_name, data, {
+                    'file_path': file_path,
+                    'streaming': streaming,
+                    'chunk_size': chunk_size,
+                    'compact': compact,
+                    'storage': load_info['storage']
+                }, load_info, partitions)
+                dataset.arrow_table = arrow_table
+                dataset.zone_map = zone_map
+                dataset.info.set_sample(sample)
+                registry.register(dataset)
                 
                 return [TextContent(
                     type="text",
-                    text=f"✅ Veri başarıyla yüklendi!\n\n{generate_data_summary()}"
+                    text=f"✅ Veri başarıyla yüklendi! (Veri seti: {dataset_name})\n\n{generate_data_summary(dataset, detailed=False)}"
                 )]
                 
             except Exception as e:
@@ -240,16 +1979,17 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
                 )]
         
         elif name == "analyze_data":
-            if current_data is None:
+            dataset = registry.get(arguments.get("dataset"))
+            if dataset is None:
                 return [TextContent(
                     type="text",
-                    text="❌ Önce veri yüklemelisiniz!"
+                    text=missing_dataset_message(arguments.get("dataset"), "❌ Önce veri yüklemelisiniz!")
                 )]
             
             query = arguments.get("query", "")
             analysis_type = arguments.get("analysis_type", "summary")
             
-            result = analyze_query(query, analysis_type)
+            result = analyze_query(dataset, query, analysis_type)
             
             return [TextContent(
                 type="text",
@@ -257,29 +1997,58 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
             )]
         
         elif name == "get_data_info":
-            if current_data is None:
+            dataset = registry.get(arguments.get("dataset"))
+            if dataset is None:
                 return [TextContent(
                     type="text",
-                    text="❌ Henüz veri yüklenmedi!"
+                    text=missing_dataset_message(arguments.get("dataset"), "❌ Henüz veri yüklenmedi!")
                 )]
             
+            if arguments.get("mode") == "approximate":
+                sample_size = arguments.get("sample_size") or PROFILE_SAMPLE_SIZE
+                summary = generate_approximate_summary(dataset, sample_size)
+                
+                if arguments.get("upgrade") and not dataset.info.exact_profile_pending:
+                    dataset.info.exact_profile_pending = True
+                    run_in_background(dataset.info.compute_exact)
+                    summary += "\n⏳ Kesin istatistikler arka planda hesaplanıyor; hazır olduğunda `mode=exact` anında yanıt verir.\n"
+            else:
+                summary = generate_data_summary(dataset)
+            
             return [TextContent(
                 type="text",
-                text=generate_data_summary()
+                text=summary + generate_registry_summary()
             )]
         
         elif name == "filter_data":
-            if current_data is None:
+            dataset = registry.get(arguments.get("dataset"))
+            if dataset is None:
                 return [TextContent(
                     type="text",
-                    text="❌ Önce veri yüklemelisiniz!"
+                    text=missing_dataset_message(arguments.get("dataset"), "❌ Önce veri yüklemelisiniz!")
                 )]
             
             column = arguments.get("column")
             operator = arguments.get("operator")
             value = arguments.get("value")
+            expression = arguments.get("expression")
             
-            result = filter_data(column, operator, value)
+            if expression is None and operator in STRING_OPERATORS:
+                expression = {
+                    "column": column,
+                    "operator": operator,
+                    "value": value,
+                    "match_mode": arguments.get("match_mode", "literal"),
+                    "case_sensitive": arguments.get("case_sensitive", True)
+                }
+            
+            if expression is None and not (column and operator):
+                return [TextContent(
+                    type="text",
+                    text="❌ 'expression' veya 'column' ve 'operator' belirtilmeli!"
+                )]
+            
+            result = filter_data(dataset, column, operator, value, expression, arguments.get("save_as"))
             
             return [TextContent(
                 type="text",
@@ -287,16 +2056,23 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
             )]
         
         elif name == "calculate_statistics":
-            if current_data is None:
+            dataset = registry.get(arguments.get("dataset"))
+            if dataset is None:
                 return [TextContent(
                     type="text",
-                    text="❌ Önce veri yüklemelisiniz!"
+                    text=missing_dataset_message(arguments.get("dataset"), "❌ Önce veri yüklemelisiniz!")
                 )]
             
             columns = arguments.get("columns", [])
-            operation = arguments.get("operation")
+            operations = arguments.get("operations") or ([arguments["operation"]] if arguments.get("operation") else [])
+            
+            if not operations:
+                return [TextContent(
+                    type="text",
+                    text="❌ 'operation' veya 'operations' belirtilmeli!"
+                )]
             
-            result = calculate_statistics(columns, operation)
+            result = calculate_statistics(dataset, columns, operations, arguments.get("approximate"))
             
             return [TextContent(
                 type="text",
@@ -304,107 +2080,1045 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
             )]
         
         elif name == "group_analysis":
-            if current_data is None:
+            dataset = registry.get(arguments.get("dataset"))
+            if dataset is None:
                 return [TextContent(
                     type="text",
-                    text="❌ Önce veri yüklemelisiniz!"
+                    text=missing_dataset_message(arguments.get("dataset"), "❌ Önce veri yüklemelisiniz!")
                 )]
             
             group_by = arguments.get("group_by")
-            agg_column = arguments.get("agg_column")
-            agg_function = arguments.get("agg_function", "count")
+            if isinstance(group_by, str):
+                group_by = [group_by]
             
-            result = group_analysis(group_by, agg_column, agg_function)
+            if not group_by:
+                return [TextContent(
+                    type="text",
+                    text="❌ 'group_by' belirtilmeli!"
+                )]
+            
+            if arguments.get("aggregations"):
+                aggregations = [(item.get("column"), item.get("function", "count")) for item in arguments["aggregations"]]
+            elif arguments.get("agg_column"):
+                aggregations = [(arguments["agg_column"], arguments.get("agg_function", "count"))]
+            else:
+                aggregations = [(None, "count")]
+            
+            result = group_analysis(dataset, group_by, aggregations, arguments.get("top_n"), arguments.get("order", "desc"))
+            
+            return [TextContent(
+                type="text",
+                text=result
+            )]
+        
+        else:
+            return [TextContent(
+                type="text",
+                text=f"❌ Bilinmeyen araç: {name}"
+            )]
+    
+    except Exception as e:
+        logger.error(f"Araç çağrısı hatası: {str(e)}")
+        return [TextContent(
+            type="text",
+            text=f"❌ Hata oluştu: {str(e)}"
+        )]
+
+def missing_dataset_message(dataset_name: Optional[str], default_message: str) -> str:
+    """Veri seti bulunamadığında gösterilecek mesaj"""
+    if dataset_name:
+        return f"❌ '{dataset_name}' veri seti bulunamadı! Yüklü veri setleri: {', '.join(registry.entries) or '-'}"
+    return default_message
+
+def should_stream(file_path: str) -> bool:
+    """Dosya boyutu eşiği aşıyorsa streaming yüklemeyi önerir"""
+    try:
+        return os.path.getsize(file_path) > STREAMING_THRESHOLD_MB * 1024 * 1024
+    except OSError:
+        return False
+
+def downcast_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Sayısal sütunları kayıpsız olarak daha küçük tiplere indirger"""
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    for col in df.select_dtypes(include=['float']).columns:
+        values = df[col]
+        if values.dtype == np.float32:
+            continue
+        # Sadece float32'ye kayıpsız dönüşebilen sütunları indir
+        downcast = values.astype(np.float32)
+        if ((downcast == values) | values.isna()).all():
+            df[col] = downcast
+    
+    return df
+
+def is_date_like(values: pd.Series) -> bool:
+    """Metin sütununun örneklemdeki tüm değerleri tarih biçiminde mi"""
+    sample = values.dropna().head(DATE_DETECTION_SAMPLE).astype(str)
+    if sample.empty or not sample.str.match(DATE_LIKE_PATTERN).all():
+        return False
+    return bool(pd.to_datetime(sample, errors='coerce').notna().all())
+
+def compact_dataframe(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Sütun tiplerini kayıpsız olarak sıkıştırır: sayısal küçültme, tarih ayrıştırma, düşük kardinaliteli metin -> category"""
+    memory_before = int(df.memory_usage(deep=True, index=False).sum())
+    dtypes_before = df.dtypes.copy()
+    dates: List[str] = []
+    categories: List[str] = []
+    
+    df = downcast_numeric_columns(df)
+    
+    for col in df.columns:
+        check_cancelled()
+        values = df[col]
+        if not (values.dtype == object or pd.api.types.is_string_dtype(values.dtype)):
+            continue
+        
+        if is_date_like(values):
+            parsed = pd.to_datetime(values, errors='coerce')
+            # Yalnızca hiçbir değer kaybolmuyorsa dönüştürülür
+            if parsed.isna().sum() == values.isna().sum():
+                df[col] = parsed
+                dates.append(col)
+                continue
+        
+        try:
+            distinct = values.nunique(dropna=True)
+        except TypeError:
+            # İç içe JSON kayıtlarındaki dict/list değerleri hash'lenemez; sütun olduğu gibi bırakılır
+            continue
+        if len(values) and distinct <= len(values) * CATEGORY_MAX_RATIO:
+            df[col] = values.astype('category')
+            categories.append(col)
+    
+    downcast = [col for col in df.columns
+                if col not in dates and col not in categories and df[col].dtype != dtypes_before[col]]
+    
+    return df, {
+        'memory_before': memory_before,
+        'memory_after': int(df.memory_usage(deep=True, index=False).sum()),
+        'downcast': downcast,
+        'dates': dates,
+        'categories': categories
+    }
+
+def use_parallel_csv(file_path: str) -> bool:
+    """Dosya paralel ayrıştırmaya değecek kadar büyük ve birden fazla çekirdek kullanılabilir mi"""
+    return CSV_PARSE_WORKERS > 1 and os.path.getsize(file_path) >= PARALLEL_CSV_MIN_MB * 1024 * 1024
+
+def find_unquoted_newline(block: bytes, offset: int, quoted: int) -> int:
+    """offset'ten sonraki, tırnak içinde olmayan ilk satır sonunu bulur; yoksa -1"""
+    # Kaçışlı tırnak ("") iki karakter olduğundan paritesi değişmez
+    while True:
+        newline = block.find(b'\n', offset)
+        if newline < 0:
+            return -1
+        quoted ^= block.count(b'"', offset, newline) & 1
+        if not quoted:
+            return newline
+        offset = newline + 1
+
+def csv_byte_ranges(file_path: str, target_bytes: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """Başlık satırını ve dosyayı satır sınırlarında bölen bayt aralıklarını döndürür (tırnak içi satır sonları bölünmez)"""
+    file_size = os.path.getsize(file_path)
+    target_bytes = max(int(target_bytes), 1)
+    
+    with open(file_path, 'rb') as handle:
+        # Tırnak paritesi dosya başından taşınır; bloklarda tırnak sayımı C hızında yapılır
+        block = handle.read(CSV_SCAN_BLOCK_SIZE)
+        header_end = find_unquoted_newline(block, 0, 0)
+        if header_end < 0:
+            return block, []
+        header = block[:header_end + 1]
+        
+        boundaries = [header_end + 1]
+        position = 0
+        quotes = 0
+        while block:
+            end = position + len(block)
+            while boundaries[-1] + target_bytes < end:
+                offset = max(boundaries[-1] + target_bytes - position, 0)
+                cut = find_unquoted_newline(block, offset, (quotes + block.count(b'"', 0, offset)) & 1)
+                if cut < 0:
+                    break
+                boundaries.append(position + cut + 1)
+            quotes += block.count(b'"')
+            position = end
+            block = handle.read(CSV_SCAN_BLOCK_SIZE)
+    
+    if boundaries[-1] < file_size:
+        boundaries.append(file_size)
+    return header, list(zip(boundaries[:-1], boundaries[1:]))
+
+def read_csv_arrow(source: Any, column_names: List[str], use_threads: bool = True) -> pd.DataFrame:
+    """CSV'yi pyarrow okuyucusuyla (bloklar paralel) okur; başlık, eksik değer ve tip kuralları pd.read_csv'ye göre ayarlanır"""
+    def open_source() -> Any:
+        return pa.BufferReader(source) if isinstance(source, bytes) else source
+    
+    # Sütun adları pandas'tan alınır (boş başlık -> 'Unnamed: N', tekrarlar -> 'ad.1'); başlık satırı atlanır
+    read_options = pa_csv.ReadOptions(use_threads=use_threads, column_names=column_names, skip_rows=1)
+    # Tırnak içindeki satır sonları blok bölmede korunur
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    
+    def read(column_types: Dict[str, Any]) -> Any:
+        convert_options = pa_csv.ConvertOptions(column_types=column_types, null_values=PANDAS_NA_VALUES,
+                                                true_values=PANDAS_TRUE_VALUES, false_values=PANDAS_FALSE_VALUES,
+                                                strings_can_be_null=True)
+        return pa_csv.read_csv(open_source(), read_options=read_options, parse_options=parse_options,
+                               convert_options=convert_options)
+    
+    def forced_types(schema: Any) -> Dict[str, Any]:
+        # pd.read_csv tarih/saat metinlerini dönüştürmez ve tamamen boş sütunu float64 okur
+        types = {field.name: pa.string() for field in schema
+                 if pa.types.is_timestamp(field.type) or pa.types.is_date(field.type) or pa.types.is_time(field.type)}
+        types.update({field.name: pa.float64() for field in schema if pa.types.is_null(field.type)})
+        return types
+    
+    with pa_csv.open_csv(open_source(), read_options=pa_csv.ReadOptions(use_threads=False, column_names=column_names,
+                                                                         skip_rows=1),
+                         parse_options=parse_options) as reader:
+        schema = reader.schema
+    
+    column_types = forced_types(schema)
+    table = read(column_types)
+    late = forced_types(table.schema)
+    if late:
+        # İlk blokta boş olup sonradan tarih çıkan sütunlar için tek seferlik yeniden okuma
+        table = read({**column_types, **late})
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        # UTF-8 olmayan metin Arrow'da bayt dizisine düşer; pandas ile aynı davranış için reddedilir
+        raise ValueError("UTF-8 olmayan metin sütunu")
+    return table.to_pandas()
+
+def csv_head_bytes(file_path: str, rows: int) -> bytes:
+    """Dosyanın başlık satırı ve ilk rows veri satırını, tırnak içi satır sonlarını bölmeden döndürür"""
+    with open(file_path, 'rb') as handle:
+        block = handle.read(CSV_SCAN_BLOCK_SIZE)
+    position = 0
+    for _ in range(rows + 1):
+        cut = find_unquoted_newline(block, position, 0)
+        if cut < 0:
+            return block
+        position = cut + 1
+    return block[:position]
+
+def csv_frames_match(expected: pd.DataFrame, actual: pd.DataFrame) -> bool:
+    """İki ayrıştırıcının sonucu sütun, tip ve değer olarak aynı mı (float'larda son basamak farkı tolere edilir)"""
+    if list(expected.columns) != list(actual.columns) or not expected.index.equals(actual.index):
+        return False
+    for col in expected.columns:
+        left, right = expected[col], actual[col]
+        if left.dtype != right.dtype:
+            return False
+        if left.dtype.kind == 'f':
+            if not np.allclose(left, right, rtol=1e-12, atol=0, equal_nan=True):
+                return False
+        elif not left.equals(right):
+            return False
+    return True
+
+def arrow_csv_schema(file_path: str) -> Optional[Dict[str, str]]:
+    """Arrow okuyucusu dosyanın başındaki örneklemde pd.read_csv ile aynı sonucu veriyorsa sütun tiplerini döndürür"""
+    if pa_csv is None:
+        return None
+    content = csv_head_bytes(file_path, CSV_SAMPLE_ROWS)
+    try:
+        expected = pd.read_csv(io.BytesIO(content))
+        actual = read_csv_arrow(content, [str(col) for col in expected.columns], use_threads=False)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.warning(f"Arrow CSV okuyucusu kullanılamadı, pandas ile okunuyor: {str(e)}")
+        return None
+    if not csv_frames_match(expected, actual):
+        logger.warning("Arrow CSV okuyucusu örneklemde pd.read_csv'den farklı sonuç verdi, pandas ile okunuyor")
+        return None
+    return {str(col): str(dtype) for col, dtype in expected.dtypes.items()}
+
+def check_arrow_csv_types(data: pd.DataFrame, schema: Dict[str, str]):
+    """Örneklemde tamsayı olup Arrow'da boşluksuz float'a dönen sütunları reddeder (ör. 2^63 üstü değerler pandas'ta uint64)"""
+    for col, dtype in schema.items():
+        values = data[col]
+        if (pd.api.types.is_integer_dtype(dtype) and values.dtype.kind == 'f' and not values.isna().any()
+                and bool((values % 1 == 0).all())):
+            raise ValueError(f"'{col}' sütunu Arrow'da tamsayı olarak okunamadı")
+
+def parse_csv_range(file_path: str, header: bytes, start: int, end: int, downcast: bool = False,
+                    schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """CSV dosyasının [start, end) bayt aralığını başlık satırıyla birlikte ayrıştırır"""
+    with open(file_path, 'rb') as handle:
+        handle.seek(start)
+        content = header + handle.read(end - start)
+    
+    if schema is not None:
+        # Arrow hatası aralık bazında pandas'a düşmez; çağıran tüm dosyayı pandas ile yeniden okur
+        data = read_csv_arrow(content, list(schema), use_threads=False)
+        check_arrow_csv_types(data, schema)
+    else:
+        data = pd.read_csv(io.BytesIO(content))
+    return downcast_numeric_columns(data) if downcast else data
+
+def iterate_csv_ranges(file_path: str, header: bytes, ranges: List[Tuple[int, int]], downcast: bool,
+                       schema: Optional[Dict[str, str]] = None):
+    """Bayt aralıklarını paralel ayrıştırır; sonuçlar dosya sırasıyla ve sınırlı sayıda bekleyen işle üretilir"""
+    # pyarrow ayrıştırırken GIL'i bırakır (iş parçacıkları yeterli); pandas ayrıştırıcısı için süreç havuzu gerekir
+    executor = (ThreadPoolExecutor(max_workers=CSV_PARSE_WORKERS, thread_name_prefix="data-csv") if schema is not None
+                else ProcessPoolExecutor(max_workers=CSV_PARSE_WORKERS))
+    pending = OrderedDict()
+    try:
+        for index, (start, end) in enumerate(ranges):
+            pending[index] = (end, executor.submit(parse_csv_range, file_path, header, start, end, downcast, schema))
+            # Bellek sınırı: aynı anda en fazla 2 x işçi sayısı aralık bekler
+            while len(pending) >= CSV_PARSE_WORKERS * 2 or (index == len(ranges) - 1 and pending):
+                check_cancelled()
+                _, (range_end, future) = pending.popitem(last=False)
+                yield range_end, future.result()
+    finally:
+        for _, future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def read_csv_parallel(file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Büyük CSV dosyasını birden fazla çekirdekte ayrıştırır"""
+    if pa_csv is not None:
+        # Arrow'un pd.read_csv'den farklı sonuç verdiği dosyalar (kodlama, indeks sütunu, tip farkı) pandas ile okunur
+        schema = arrow_csv_schema(file_path)
+        if schema is None:
+            return pd.read_csv(file_path), {'mode': 'standard'}
+        # Arrow iş parçacığı havuzu yapılandırılan işçi sayısına genişletilir
+        if pa.cpu_count() < CSV_PARSE_WORKERS:
+            pa.set_cpu_count(CSV_PARSE_WORKERS)
+        try:
+            data = read_csv_arrow(file_path, list(schema))
+            check_arrow_csv_types(data, schema)
+            return data, {'mode': 'parallel', 'parser': 'arrow', 'workers': pa.cpu_count()}
+        except ValueError as e:
+            logger.warning(f"Arrow CSV okuyucusu kullanılamadı, pandas ile okunuyor: {str(e)}")
+            return pd.read_csv(file_path), {'mode': 'standard'}
+    
+    file_size = os.path.getsize(file_path)
+    # İşçi başına birkaç aralık: yük dengesi için
+    header, ranges = csv_byte_ranges(file_path, file_size / (CSV_PARSE_WORKERS * 4))
+    if not ranges:
+        return pd.read_csv(file_path), {'mode': 'standard'}
+    frames = [frame for _, frame in iterate_csv_ranges(file_path, header, ranges, downcast=False)]
+    data = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return data, {'mode': 'parallel', 'parser': 'process', 'workers': CSV_PARSE_WORKERS, 'ranges': len(ranges)}
+
+def estimate_row_bytes(file_path: str, sample_bytes: int = 1024 * 1024) -> float:
+    """Dosyanın başından ortalama satır uzunluğunu tahmin eder"""
+    with open(file_path, 'rb') as handle:
+        sample = handle.read(sample_bytes)
+    return len(sample) / max(sample.count(b'\n'), 1)
+
+def load_csv_chunked(file_path: str, chunk_size: int = CHUNK_SIZE) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """CSV dosyasını parça parça okur, her parçayı küçültür ve birleştirir"""
+    file_size = os.path.getsize(file_path)
+    chunks: List[pd.DataFrame] = []
+    sampler = ReservoirSampler(PROFILE_SAMPLE_SIZE)
+    total_rows = 0
+    parallel = use_parallel_csv(file_path)
+    
+    schema = None
+    if parallel and pa_csv is not None:
+        schema = arrow_csv_schema(file_path)
+        parallel = schema is not None
+    
+    with open(file_path, 'rb') as handle:
+        if parallel:
+            # Parçalar satır sınırında bölünmüş bayt aralıklarıdır ve işçilerde ayrıştırılıp küçültülür
+            header, ranges = csv_byte_ranges(file_path, chunk_size * estimate_row_bytes(file_path))
+            stream = iterate_csv_ranges(file_path, header, ranges, downcast=True, schema=schema)
+        else:
+            stream = ((None, downcast_numeric_columns(chunk)) for chunk in pd.read_csv(handle, chunksize=chunk_size))
+        
+        while True:
+            try:
+                for position, chunk in stream:
+                    check_cancelled()
+                    chunks.append(chunk)
+                    sampler.update(chunks[-1])
+                    total_rows += len(chunk)
+                    
+                    position = handle.tell() if position is None else position
+                    progress = min(position / file_size * 100, 100.0) if file_size else 100.0
+                    logger.info(f"Streaming yükleme: {len(chunks)}. parça, {total_rows:,} satır (%{progress:.0f})")
+                break
+            except ValueError as e:
+                if schema is None:
+                    raise
+                # Bir aralıkta Arrow sonucu pandas'tan ayrıldı: parçalar arası tip tutarlılığı için
+                # dosyanın tamamı baştan pandas ile okunur
+                logger.warning(f"Arrow CSV okuyucusu kullanılamadı, pandas ile yeniden okunuyor: {str(e)}")
+                chunks.clear()
+                sampler = ReservoirSampler(PROFILE_SAMPLE_SIZE)
+                total_rows = 0
+                schema = None
+                parallel = False
+                handle.seek(0)
+                stream = ((None, downcast_numeric_columns(chunk))
+                          for chunk in pd.read_csv(handle, chunksize=chunk_size))
+    
+    if not chunks:
+        data = pd.read_csv(file_path)
+    elif len(chunks) == 1:
+        data = chunks[0]
+    else:
+        data = pd.concat(chunks, ignore_index=True)
+        # Parçalar arasında tip farkı oluştuysa birleşik sütunları tekrar küçült
+        data = downcast_numeric_columns(data)
+    
+    return data, {
+        'mode': 'streaming',
+        'chunks': len(chunks),
+        'chunk_size': chunk_size,
+        'file_size': file_size,
+        'parallel': parallel,
+        'sample': sampler.sample
+    }
+
+def json_layout(file_path: str) -> str:
+    """JSON dosyasının yapısını belirler: 'lines' (NDJSON), 'array' (kayıt dizisi) veya 'document'"""
+    if os.path.splitext(file_path)[1].lower() in JSON_LINES_EXTENSIONS:
+        return 'lines'
+    
+    with open(file_path, 'r', encoding='utf-8') as handle:
+        head = handle.read(JSON_READ_BLOCK_SIZE).lstrip('\ufeff \t\r\n')
+    if head.startswith('['):
+        return 'array'
+    
+    # İlk satırı tek başına geçerli bir nesne olan ve devamı bulunan .json dosyası JSON Lines kabul edilir
+    first_line, newline, rest = head.partition('\n')
+    if head.startswith('{') and newline and rest.strip():
+        try:
+            if isinstance(json.loads(first_line), dict):
+                return 'lines'
+        except ValueError:
+            pass
+    return 'document'
+
+def iterate_json_array(file_path: str, batch_rows: int):
+    """JSON kayıt dizisini partiler halinde DataFrame'e çevirir; bellekte aynı anda yalnızca bir partinin metni tutulur"""
+    decoder = json.JSONDecoder()
+    # İlk parti kayıt kayıt çözülür; sonraki partiler ortalama kayıt uzunluğuyla metinden tek seferde kesilir
+    batch_chars: Optional[int] = None
+    fast = True
+    
+    with open(file_path, 'r', encoding='utf-8') as handle:
+        buffer = handle.read(JSON_READ_BLOCK_SIZE).lstrip('\ufeff')
+        position = buffer.index('[') + 1
+        exhausted = False
+        
+        while True:
+            check_cancelled()
+            position = JSON_SEPARATOR_PATTERN.match(buffer, position).end()
+            buffer, position = buffer[position:], 0
+            wanted = (batch_chars or JSON_READ_BLOCK_SIZE) + 1
+            while not exhausted and len(buffer) < wanted:
+                block = handle.read(max(JSON_READ_BLOCK_SIZE, wanted - len(buffer)))
+                exhausted = not block
+                buffer += block
+                position = JSON_SEPARATOR_PATTERN.match(buffer, position).end()
+            if position >= len(buffer):
+                raise ValueError("JSON dizisi tamamlanmamış")
+            if buffer[position] == ']':
+                break
+            
+            if fast and batch_chars:
+                end = buffer.rfind('}', position, position + batch_chars) + 1
+                if end > 0:
+                    # Kesim bir dizgi ya da iç içe nesne içine düşerse metin geçersiz olur ve ayrıştırma hata verir
+                    try:
+                        frame = pd.read_json(io.StringIO(f"[{buffer[position:end]}]"))
+                    except ValueError:
+                        fast = False
+                    else:
+                        position = end
+                        yield frame
+                        continue
+            
+            records: List[str] = []
+            while len(records) < batch_rows:
+                position = JSON_SEPARATOR_PATTERN.match(buffer, position).end()
+                if position < len(buffer) and buffer[position] == ']':
+                    break
+                end = -1
+                if position < len(buffer):
+                    try:
+                        end = decoder.raw_decode(buffer, position)[1]
+                    except json.JSONDecodeError:
+                        if exhausted:
+                            raise
+                # Tamponun sonuna dayanan kayıt (ör. yarım sayı) yeni blokla birlikte yeniden çözülür
+                if end < 0 or (end == len(buffer) and not exhausted):
+                    if exhausted:
+                        raise ValueError("JSON dizisi tamamlanmamış")
+                    block = handle.read(JSON_READ_BLOCK_SIZE)
+                    exhausted = not block
+                    buffer, position = buffer[position:] + block, 0
+                    continue
+                records.append(buffer[position:end])
+                position = end
+            
+            if records:
+                if batch_chars is None:
+                    batch_chars = max(sum(map(len, records)) * batch_rows // len(records), 1)
+                yield pd.read_json(io.StringIO(f"[{','.join(records)}]"))
+
+def conform_json_batch(batch: pd.DataFrame, schema: Dict[str, Any]) -> pd.DataFrame:
+    """Partiyi örneklemden çıkarılan şemaya hizalar: sütun sırası korunur, tamamen boş sütunlar şema tipini alır"""
+    for col in batch.columns:
+        if col not in schema:
+            # Örneklemde görülmeyen alan şemanın sonuna eklenir
+            schema[col] = batch[col].dtype
+    batch = batch.reindex(columns=list(schema))
+    
+    for col, dtype in schema.items():
+        values = batch[col]
+        # Tüm değerleri boş partide pandas tipi float/object çıkarır; birleştirmede tip kaymasını önler
+        if (values.dtype == dtype or pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)
+                or not values.isna().all()):
+            continue
+        try:
+            batch[col] = values.astype(dtype)
+        except (TypeError, ValueError):
+            pass
+    return batch
+
+def load_json_chunked(file_path: str, layout: str, chunk_size: int = CHUNK_SIZE) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """NDJSON veya JSON kayıt dizisini partiler halinde okur; şema ilk partiden çıkarılır, bellek parti boyutuyla sınırlıdır"""
+    file_size = os.path.getsize(file_path)
+    chunks: List[pd.DataFrame] = []
+    sampler = ReservoirSampler(PROFILE_SAMPLE_SIZE)
+    schema: Optional[Dict[str, Any]] = None
+    total_rows = 0
+    
+    if layout == 'lines':
+        reader = pd.read_json(file_path, lines=True, chunksize=chunk_size)
+        batches = iter(reader)
+    else:
+        reader = None
+        batches = iterate_json_array(file_path, chunk_size)
+    
+    try:
+        for batch in batches:
+            check_cancelled()
+            if schema is None:
+                schema = dict(batch.dtypes)
+                logger.info(f"JSON şeması ilk {len(batch):,} kayıttan çıkarıldı: {len(schema)} sütun")
+            chunks.append(downcast_numeric_columns(conform_json_batch(batch, schema)))
+            sampler.update(chunks[-1])
+            total_rows += len(batch)
+            logger.info(f"Streaming JSON yükleme: {len(chunks)}. parti, {total_rows:,} kayıt")
+    finally:
+        if reader is not None:
+            reader.close()
+    
+    chunk_count = len(chunks)
+    if not chunks:
+        data = pd.DataFrame()
+    else:
+        # Sonradan eklenen sütunlar önceki partilerde boş olarak yer alır
+        columns = list(schema)
+        data = pd.concat([chunk.reindex(columns=columns) for chunk in chunks], ignore_index=True)
+    chunks.clear()
+    data = downcast_numeric_columns(data)
+    
+    return data, {
+        'mode': 'streaming',
+        'format': 'NDJSON' if layout == 'lines' else 'JSON dizisi',
+        'chunks': chunk_count,
+        'chunk_size': chunk_size,
+        'file_size': file_size,
+        'sample': sampler.sample
+    }
+
+def write_partitioned_dataset(file_path: str, directory: str, chunk_size: int) -> Tuple[PartitionedDataset, Optional[pd.DataFrame]]:
+    """CSV dosyasını parça parça Arrow IPC dosyalarına yazar; bellekte aynı anda tek parça tutulur"""
+    temp_directory = f"{directory}.{os.getpid()}.tmp"
+    os.makedirs(temp_directory, exist_ok=True)
+    sampler = ReservoirSampler(PROFILE_SAMPLE_SIZE)
+    manifest: Dict[str, Any] = {'files': [], 'rows': [], 'null_counts': {}, 'column_bytes': {}}
+    # Kantil ve farklı değer taslakları parçalar yazılırken güncellenir; sonradan tarama gerekmez
+    sketches: Dict[str, ColumnSketch] = {}
+    zones: Dict[str, Dict[str, Any]] = {}
+    unzoned: set = set()
+    
+    try:
+        for chunk in pd.read_csv(file_path, chunksize=chunk_size):
+            check_cancelled()
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            file_name = f"part-{len(manifest['files']):06d}.arrow"
+            with pa.OSFile(os.path.join(temp_directory, file_name), 'wb') as sink:
+                with pa_ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
             
-            return [TextContent(
-                type="text",
-                text=result
-            )]
+            manifest['files'].append(file_name)
+            manifest['rows'].append(len(chunk))
+            for col, column in zip(table.column_names, table.columns):
+                manifest['null_counts'][col] = manifest['null_counts'].get(col, 0) + int(column.null_count)
+                manifest['column_bytes'][col] = manifest['column_bytes'].get(col, 0) + int(column.nbytes)
+            part_zones = ZoneMap.build(chunk, block_rows=max(len(chunk), 1)).to_dict()['columns']
+            for col in chunk.columns:
+                # Bir parçada bile desteklenmeyen tipe düşen sütun için parça budaması yapılmaz
+                if col not in part_zones or (col in zones and zones[col]['dtype'] != part_zones[col]['dtype']):
+                    unzoned.add(col)
+                elif col not in unzoned:
+                    zone = zones.setdefault(col, {'dtype': part_zones[col]['dtype'], 'min': [], 'max': []})
+                    zone['min'] += part_zones[col]['min']
+                    zone['max'] += part_zones[col]['max']
+                sketch = build_column_sketch(chunk[col])
+                if col in sketches:
+                    sketches[col].merge(sketch)
+                else:
+                    sketches[col] = sketch
+            sampler.update(chunk)
+            logger.info(f"Out-of-core yazma: {len(manifest['files'])}. parça, {sum(manifest['rows']):,} satır")
+        
+        if not manifest['files']:
+            raise ValueError("Dosyada veri bulunamadı")
+        manifest['zones'] = {'block_rows': None,
+                             'columns': {col: zone for col, zone in zones.items() if col not in unzoned}}
         
+        if sampler.sample is not None:
+            write_cached_table(os.path.join(temp_directory, "sample.arrow"), sampler.sample)
+        with open(os.path.join(temp_directory, "sketches.json"), 'w', encoding='utf-8') as handle:
+            json.dump({col: sketch.to_dict() for col, sketch in sketches.items()}, handle)
+        # Manifesto en son yazılır; dizin yalnızca tamamlandığında yerine taşınır
+        with open(os.path.join(temp_directory, "manifest.json"), 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle)
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+        os.replace(temp_directory, directory)
+    except BaseException:
+        shutil.rmtree(temp_directory, ignore_errors=True)
+        raise
+    
+    return PartitionedDataset(directory, manifest), sampler.sample
+
+def load_partitioned_dataset(file_path: str, chunk_size: int,
+                             use_cache: bool = True) -> Tuple[PartitionedDataset, Dict[str, Any]]:
+    """Dosyayı out-of-core parçalarına çevirir; değişmemiş dosyanın mevcut parçalarını yeniden kullanır"""
+    if pa is None:
+        raise ValueError("out_of_core depolama için pyarrow kurulu olmalı")
+    if os.path.splitext(file_path)[1].lower() != '.csv':
+        raise ValueError("out_of_core depolama yalnızca CSV dosyalarını destekler")
+    
+    fingerprint = file_fingerprint(file_path, {'out_of_core': True, 'chunk_size': chunk_size})
+    directory = os.path.join(OUT_OF_CORE_DIR, fingerprint)
+    load_info: Dict[str, Any] = {'mode': 'out_of_core', 'chunk_size': chunk_size, 'storage': 'out_of_core'}
+    
+    partitions = PartitionedDataset.open(directory) if use_cache else None
+    if partitions is not None:
+        logger.info(f"Mevcut out-of-core parçaları kullanılıyor: {file_path}")
+        sample_path = os.path.join(directory, "sample.arrow")
+        if os.path.exists(sample_path):
+            with pa.memory_map(sample_path, 'r') as source:
+                load_info['sample'] = pa_ipc.open_file(source).read_all().to_pandas()
+        load_info['reused'] = True
+    else:
+        partitions, load_info['sample'] = write_partitioned_dataset(file_path, directory, chunk_size)
+    
+    load_info['chunks'] = len(partitions.files)
+    load_info['partition_bytes'] = partitions.nbytes
+    return partitions, load_info
+
+def parse_dataset_file(file_path: str, streaming: bool, chunk_size: int) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Dosyayı uzantısına göre kaynaktan ayrıştırır"""
+    file_extension = os.path.splitext(file_path)[1].lower()
+    
+    if file_extension == '.csv':
+        if streaming:
+            return load_csv_chunked(file_path, chunk_size)
+        if use_parallel_csv(file_path):
+            return read_csv_parallel(file_path)
+        return pd.read_csv(file_path), {'mode': 'standard'}
+    elif file_extension in ['.xlsx', '.xls']:
+        return pd.read_excel(file_path), {'mode': 'standard'}
+    elif file_extension in ['.json'] + JSON_LINES_EXTENSIONS:
+        layout = json_layout(file_path)
+        if streaming and layout != 'document':
+            return load_json_chunked(file_path, layout, chunk_size)
+        # Kayıt listesi olmayan JSON belgeleri parçalanamaz; streaming istenmediyse pd.read_json tipleri korunur
+        return pd.read_json(file_path, lines=layout == 'lines'), {'mode': 'standard'}
+    
+    raise ValueError(f"Desteklenmeyen dosya formatı: {file_extension}")
+
+def load_dataset_file(file_path: str, streaming: bool, chunk_size: int, use_cache: bool = True,
+                      compact: bool = False, storage: str = "memory") -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Dosyayı önbellekten, yoksa kaynaktan yükler ve önbelleğe yazar"""
+    fingerprint = None
+    mapped = storage == "arrow_mmap"
+    
+    if mapped and not cache_available():
+        raise ValueError("arrow_mmap depolama için pyarrow kurulu ve DATA_CACHE_ENABLED açık olmalı")
+    
+    if (use_cache or mapped) and cache_available():
+        options = {'streaming': bool(streaming)}
+        if compact:
+            # Sıkıştırılmış tipler önbellekte ayrı saklanır (Arrow dictionary/timestamp)
+            options['compact'] = True
+        fingerprint = file_fingerprint(file_path, options)
+        table = open_cached_table(fingerprint) if use_cache else None
+        if table is not None:
+            logger.info(f"Önbellekten yüklendi: {file_path}")
+            load_info = {'mode': 'cache', 'cache_key': fingerprint, 'compacted': compact, 'storage': storage}
+            if mapped:
+                load_info['arrow_table'] = table
+            data = arrow_table_to_frame(table, mapped)
+            # Eski önbellek dosyalarında zone map yoksa bellekteki veriden çıkarılır
+            zone_map = cached_zone_map(table)
+            load_info['zone_map'] = zone_map if zone_map is not None else ZoneMap.build(data)
+            return data, load_info
+    
+    data, load_info = parse_dataset_file(file_path, streaming, chunk_size)
+    load_info['storage'] = "memory"
+    
+    if compact:
+        data, load_info['compaction'] = compact_dataframe(data)
+    
+    # Blok min/max özeti son tiplerle tek geçişte çıkarılır ve önbellek dosyasıyla birlikte saklanır
+    load_info['zone_map'] = ZoneMap.build(data)
+    
+    if fingerprint is not None and write_cached_dataset(fingerprint, data, load_info['zone_map']):
+        load_info['cache_key'] = fingerprint
+        table = open_cached_table(fingerprint) if mapped else None
+        if table is not None:
+            # Ayrıştırılan özel kopya bırakılır; sütunlar yazılan dosyanın sayfalarına bakar
+            data = arrow_table_to_frame(table, mapped=True)
+            load_info['arrow_table'] = table
+            load_info['storage'] = storage
+    
+    if mapped and load_info['storage'] != storage:
+        logger.warning(f"Arrow dosyası oluşturulamadı, veri bellekte tutuluyor: {file_path}")
+    
+    return data, load_info
+
+ZONE_MAP_METADATA_KEY = b'zone_maps'
+
+def cache_available() -> bool:
+    """Kolonlu önbellek kullanılabilir mi"""
+    return CACHE_ENABLED and pa is not None
+
+def file_fingerprint(file_path: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Dosya yolu, boyutu, değişiklik zamanı ve içerik özetinden anahtar üretir"""
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    digest.update(os.path.abspath(file_path).encode('utf-8'))
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    digest.update(json.dumps(options or {}, sort_keys=True).encode('utf-8'))
+    
+    # Büyük dosyalarda tamamını okumamak için baş, orta ve son blokları özetle
+    with open(file_path, 'rb') as handle:
+        if stat.st_size <= 3 * FINGERPRINT_BLOCK_SIZE:
+            digest.update(handle.read())
         else:
-            return [TextContent(
-                type="text",
-                text=f"❌ Bilinmeyen araç: {name}"
-            )]
+            for offset in (0, stat.st_size // 2, stat.st_size - FINGERPRINT_BLOCK_SIZE):
+                handle.seek(offset)
+                digest.update(handle.read(FINGERPRINT_BLOCK_SIZE))
+    
+    return digest.hexdigest()
+
+def cache_file_path(fingerprint: str) -> str:
+    """Önbellek dosyasının yolunu döndürür"""
+    return os.path.join(CACHE_DIR, f"{fingerprint}.arrow")
+
+def open_cached_table(fingerprint: str) -> Any:
+    """Önbellekteki Arrow IPC dosyasını memory-map ile açar (tamponlar dosya sayfalarına bakar)"""
+    path = cache_file_path(fingerprint)
+    if not os.path.exists(path):
+        return None
     
+    try:
+        with pa.memory_map(path, 'r') as source:
+            table = pa_ipc.open_file(source).read_all()
+        os.utime(path)
+        return table
     except Exception as e:
-        logger.error(f"Araç çağrısı hatası: {str(e)}")
-        return [TextContent(
-            type="text",
-            text=f"❌ Hata oluştu: {str(e)}"
-        )]
+        logger.warning(f"Önbellek okunamadı, kaynaktan yüklenecek: {str(e)}")
+        return None
+
+def arrow_table_to_frame(table: Any, mapped: bool = False) -> pd.DataFrame:
+    """Arrow tablosunu DataFrame'e çevirir; mapped ise sütunlar kopyalanmaz"""
+    if mapped:
+        # split_blocks: sütunlar tek bloğa birleştirilmez, boşluksuz sayısal sütunlar
+        # mmap tamponlarına bakan salt okunur numpy görünümleri, metinler Arrow dizileri olur
+        return table.to_pandas(split_blocks=True)
+    return table.to_pandas()
 
-def analyze_data_structure():
-    """Veri yapısını analiz eder"""
-    global data_info
+def read_cached_dataset(fingerprint: str) -> Optional[pd.DataFrame]:
+    """Önbellekteki Arrow IPC dosyasını memory-map ile okuyup belleğe kopyalar"""
+    table = open_cached_table(fingerprint)
+    return arrow_table_to_frame(table) if table is not None else None
+
+def write_cached_table(path: str, data: pd.DataFrame, zone_map: Optional[ZoneMap] = None):
+    """DataFrame'i sıkıştırılmamış Arrow IPC dosyasına yazar; zone map şema metadatasında saklanır"""
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    if zone_map is not None:
+        metadata = dict(table.schema.metadata or {})
+        metadata[ZONE_MAP_METADATA_KEY] = json.dumps(zone_map.to_dict()).encode('utf-8')
+        table = table.replace_schema_metadata(metadata)
+    with pa.OSFile(path, 'wb') as sink:
+        with pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def cached_zone_map(table: Any) -> Optional[ZoneMap]:
+    """Önbellek dosyasının metadatasındaki zone map'i okur"""
+    metadata = table.schema.metadata or {}
+    if ZONE_MAP_METADATA_KEY not in metadata:
+        return None
+    return ZoneMap.from_dict(json.loads(metadata[ZONE_MAP_METADATA_KEY]))
+
+def write_cached_dataset(fingerprint: str, data: pd.DataFrame, zone_map: Optional[ZoneMap] = None) -> bool:
+    """Veriyi sıkıştırılmamış Arrow IPC dosyası olarak önbelleğe yazar"""
+    path = cache_file_path(fingerprint)
+    temp_path = f"{path}.{os.getpid()}.tmp"
     
-    if current_data is None:
-        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_cached_table(temp_path, data, zone_map)
+        os.replace(temp_path, path)
+        prune_cache(keep=path)
+        return True
+    except Exception as e:
+        logger.warning(f"Önbelleğe yazılamadı: {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def prune_cache(keep: Optional[str] = None):
+    """Önbellek boyutu sınırı aşarsa en eski dosyaları siler"""
+    entries = []
+    for file_name in os.listdir(CACHE_DIR):
+        if file_name.endswith('.arrow'):
+            path = os.path.join(CACHE_DIR, file_name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
     
-    data_info = {
-        'shape': current_data.shape,
-        'columns': list(current_data.columns),
-        'dtypes': current_data.dtypes.to_dict(),
-        'null_counts': current_data.isnull().sum().to_dict(),
-        'memory_usage': current_data.memory_usage(deep=True).sum(),
-        'numeric_columns': list(current_data.select_dtypes(include=[np.number]).columns),
-        'categorical_columns': list(current_data.select_dtypes(include=['object']).columns),
-        'summary_stats': current_data.describe().to_dict() if not current_data.empty else {}
-    }
+    total_size = sum(size for _, size, _ in entries)
+    limit = CACHE_MAX_MB * 1024 * 1024
+    
+    for _, size, path in sorted(entries):
+        if total_size <= limit:
+            break
+        if path == keep:
+            continue
+        os.remove(path)
+        total_size -= size
+        logger.info(f"Önbellekten silindi: {path}")
+
+def restore_dataset(dataset: DatasetEntry) -> pd.DataFrame:
+    """Bellekten çıkarılmış veri setini diskteki kopyasından geri yükler"""
+    mapped = dataset.source.get('storage') == "arrow_mmap"
+    if dataset.spill_key is not None:
+        table = open_cached_table(dataset.spill_key)
+        if table is not None:
+            logger.info(f"Veri seti diskten geri yüklendi: {dataset.name}")
+            dataset.arrow_table = table if mapped else None
+            return arrow_table_to_frame(table, mapped)
+    
+    # Diskteki kopya silinmişse kaynak dosyadan yeniden yükle
+    source = dataset.source
+    data, load_info = load_dataset_file(source['file_path'], source['streaming'], source['chunk_size'],
+                                        compact=source.get('compact', False), storage=source.get('storage', "memory"))
+    dataset.arrow_table = load_info.get('arrow_table')
+    cache_key = load_info.get('cache_key')
+    if cache_key is None or cache_key != dataset.load_info.get('cache_key'):
+        # Kaynak dosya ilk yüklemeden sonra değişmiş olabilir: profil, indeksler ve önbellekli sonuçlar geçersizdir
+        logger.info(f"Kaynak dosya değişmiş olabilir, profil yenileniyor: {dataset.name}")
+        dataset.replace_data(data)
+        dataset.zone_map = load_info.get('zone_map')
+        dataset.spill_key = cache_key
+    return data
+
+def format_load_info(load_info: Dict[str, Any]) -> str:
+    """Yükleme bilgisini özet satırına çevirir"""
+    if load_info.get('mode') == 'cache':
+        compacted = ", tipler sıkıştırılmış" if load_info.get('compacted') else ""
+        lines = f"**Yükleme:** önbellekten (Arrow IPC, memory-mapped{compacted})\n"
+    else:
+        lines = ""
+    
+    if load_info.get('mode') == 'view':
+        lines += (f"**Görünüm:** '{load_info['base']}' üzerinde {load_info['filter']} "
+                  f"(satırlar kopyalanmadı; sütunlar ihtiyaç anında seçim vektöründen toplanır)\n")
+    
+    if load_info.get('mode') == 'out_of_core':
+        reused = ", mevcut parçalar kullanıldı" if load_info.get('reused') else ""
+        lines += (f"**Yükleme:** out-of-core ({load_info['chunks']} parça x {load_info['chunk_size']:,} satır, "
+                  f"diskte {load_info['partition_bytes'] / 1024 / 1024:.2f} MB{reused}); "
+                  f"filter_data, calculate_statistics ve group_analysis parçaları tarar\n")
+    
+    if load_info.get('mode') == 'streaming':
+        parallel = ", paralel ayrıştırma" if load_info.get('parallel') else ""
+        source_format = f"{load_info['format']}, " if load_info.get('format') else ""
+        lines += (f"**Yükleme:** streaming ({source_format}{load_info['chunks']} parça x {load_info['chunk_size']:,} satır, "
+                  f"dosya {load_info['file_size'] / 1024 / 1024:.2f} MB{parallel})\n")
+    
+    if load_info.get('mode') == 'parallel':
+        if load_info['parser'] == 'arrow':
+            lines += f"**Yükleme:** paralel CSV ayrıştırma (Arrow çok iş parçacıklı okuyucu, {load_info['workers']} çekirdek)\n"
+        else:
+            lines += (f"**Yükleme:** paralel CSV ayrıştırma ({load_info['ranges']} bayt aralığı, "
+                      f"{load_info['workers']} süreç)\n")
+    
+    compaction = load_info.get('compaction')
+    if compaction:
+        changes = [f"{len(compaction[key])} {label}" for key, label in
+                   (('downcast', 'sayısal küçültme'), ('categories', 'category'), ('dates', 'tarih'))
+                   if compaction[key]]
+        lines += (f"**Tip sıkıştırma:** {compaction['memory_before'] / 1024 / 1024:.2f} MB → "
+                  f"{compaction['memory_after'] / 1024 / 1024:.2f} MB"
+                  f" ({', '.join(changes) if changes else 'değişiklik yok'})\n")
+    
+    if load_info.get('storage') == "arrow_mmap":
+        lines += "**Depolama:** memory-mapped Arrow (kopyasız sütunlar, sayfalar işletim sistemi önbelleğinden paylaşılır)\n"
+    return lines
 
-def generate_data_summary() -> str:
+def generate_data_summary(dataset: DatasetEntry, detailed: bool = True) -> str:
     """Veri özetini oluşturur"""
-    if current_data is None or not data_info:
-        return "Henüz veri yüklenmedi."
+    info = dataset.info
+    
+    if detailed:
+        memory_line = f"**Bellek Kullanımı:** {info.memory_usage / 1024 / 1024:.2f} MB"
+    else:
+        memory_line = f"**Bellek Kullanımı (tahmini):** {info.estimated_memory_usage / 1024 / 1024:.2f} MB"
     
     summary = f"""
 ## 📊 Veri Özeti
 
-**Boyut:** {data_info['shape'][0]:,} satır, {data_info['shape'][1]} sütun
-**Bellek Kullanımı:** {data_info['memory_usage'] / 1024 / 1024:.2f} MB
-
+**Boyut:** {info.shape[0]:,} satır, {info.shape[1]} sütun
+{memory_line}
+{format_load_info(dataset.load_info)}
 ### Sütunlar:
-{', '.join(data_info['columns'])}
+{', '.join(info.columns)}
 
 ### Veri Tipleri:
 """
     
-    for col, dtype in data_info['dtypes'].items():
-        null_count = data_info['null_counts'][col]
-        null_percent = (null_count / data_info['shape'][0]) * 100
+    for col, dtype in info.dtypes.items():
+        if not detailed:
+            summary += f"- **{col}:** {dtype}\n"
+            continue
+        null_count = info.null_count(col)
+        null_percent = (null_count / info.shape[0]) * 100 if info.shape[0] else 0.0
         summary += f"- **{col}:** {dtype} (Eksik: {null_count} - %{null_percent:.1f})\n"
     
-    if data_info['numeric_columns']:
-        summary += f"\n### 🔢 Sayısal Sütunlar ({len(data_info['numeric_columns'])} adet):\n"
-        summary += f"{', '.join(data_info['numeric_columns'])}\n"
+    if info.numeric_columns:
+        summary += f"\n### 🔢 Sayısal Sütunlar ({len(info.numeric_columns)} adet):\n"
+        summary += f"{', '.join(info.numeric_columns)}\n"
+    
+    if info.categorical_columns:
+        summary += f"\n### 📝 Kategorik Sütunlar ({len(info.categorical_columns)} adet):\n"
+        summary += f"{', '.join(info.categorical_columns)}\n"
+    
+    if not detailed:
+        summary += "\nEksik değer ve detaylı bellek bilgisi için `get_data_info` kullanın.\n"
+    
+    return summary
+
+def generate_approximate_summary(dataset: DatasetEntry, sample_size: int = PROFILE_SAMPLE_SIZE) -> str:
+    """Rastgele örneklem üzerinden hata paylı yaklaşık veri özeti oluşturur"""
+    info = dataset.info
+    total_rows = info.shape[0]
+    sample = info.sample(sample_size)
+    k = len(sample)
+    
+    if k == 0:
+        return generate_data_summary(dataset, detailed=False)
+    
+    scale = total_rows / k
+    # Sonlu popülasyon düzeltmesi: örneklem tüm tabloysa hata payı sıfırdır
+    fpc = np.sqrt((total_rows - k) / (total_rows - 1)) if total_rows > 1 else 0.0
+    
+    memory = sum(
+        info.column_memory(col) if info.has_stat(col, 'memory')
+        else sample[col].memory_usage(deep=True, index=False) * scale
+        for col in info.columns
+    )
+    
+    summary = f"""
+## 📊 Veri Özeti (Yaklaşık)
+
+**Boyut:** {total_rows:,} satır, {info.shape[1]} sütun
+**Örneklem:** {k:,} satır (%{k / total_rows * 100:.2f}), %95 güven aralığı
+**Bellek Kullanımı (tahmini):** {memory / 1024 / 1024:.2f} MB
+{format_load_info(dataset.load_info)}
+### Veri Tipleri:
+"""
+    
+    for col, dtype in info.dtypes.items():
+        if info.has_stat(col, 'null_count'):
+            null_count = info.null_count(col)
+            summary += f"- **{col}:** {dtype} (Eksik: {null_count} - %{null_count / total_rows * 100:.1f}, kesin)\n"
+            continue
+        
+        p = float(sample[col].isnull().mean())
+        margin = CONFIDENCE_Z * np.sqrt(p * (1 - p) / k) * fpc
+        summary += (f"- **{col}:** {dtype} (Eksik: ~{p * total_rows:,.0f} ± {margin * total_rows:,.0f} - "
+                    f"%{p * 100:.1f} ± {margin * 100:.1f})\n")
+    
+    if info.numeric_columns:
+        summary += "\n### 🔢 Sayısal Sütunlar (Örneklem Ortalaması):\n"
+        for col in info.numeric_columns:
+            values = sample[col].dropna()
+            if len(values) == 0:
+                summary += f"- **{col}:** örneklemde değer yok\n"
+                continue
+            margin = CONFIDENCE_Z * values.std(ddof=1) / np.sqrt(len(values)) * fpc if len(values) > 1 else 0.0
+            summary += f"- **{col}:** {values.mean():,.2f} ± {margin:,.2f}\n"
+    
+    if info.categorical_columns:
+        summary += f"\n### 📝 Kategorik Sütunlar ({len(info.categorical_columns)} adet):\n"
+        summary += f"{', '.join(info.categorical_columns)}\n"
+        # Yüklemede oluşturulmuş taslaklar varsa farklı değer sayıları ek maliyetsiz gösterilir
+        sketched = [col for col in info.categorical_columns if info.has_stat(col, 'sketch')]
+        for col in sketched:
+            summary += f"- **{col}:** ~{info.sketch(col).distinct.estimate():,.0f} farklı değer (HyperLogLog)\n"
+    
+    return summary
+
+def generate_registry_summary() -> str:
+    """Kayıt defterindeki veri setlerini listeler"""
+    if len(registry) <= 1:
+        return ""
     
-    if data_info['categorical_columns']:
-        summary += f"\n### 📝 Kategorik Sütunlar ({len(data_info['categorical_columns'])} adet):\n"
-        summary += f"{', '.join(data_info['categorical_columns'])}\n"
+    summary = f"\n### 🗂️ Yüklü Veri Setleri ({len(registry)} adet, bütçe: {DATASET_MEMORY_BUDGET_MB:.0f} MB):\n"
+    for name, entry in reversed(registry.entries.items()):
+        resident = f"{entry.memory_bytes / 1024 / 1024:.2f} MB bellekte"
+        if isinstance(entry, DatasetView):
+            state = f"{resident}, '{entry.base.name}' görünümü"
+        elif entry.loaded:
+            state = resident
+        else:
+            state = f"bellekten çıkarıldı ({resident}, diskte {entry.disk_bytes / 1024 / 1024:.2f} MB)"
+        active = " (aktif)" if name == registry.active else ""
+        summary += f"- **{name}**{active}: {entry.info.shape[0]:,} satır, {state}\n"
     
     return summary
 
-def analyze_query(query: str, analysis_type: str = "summary") -> str:
+def analyze_query(dataset: DatasetEntry, query: str, analysis_type: str = "summary") -> str:
     """Sorgu analizi yapar"""
+    info = dataset.info
+    
     query_lower = query.lower()
     
     if analysis_type == "summary" or any(word in query_lower for word in ['özet', 'summary', 'genel']):
-        return generate_data_summary()
+        return generate_data_summary(dataset)
     
     elif analysis_type == "statistics" or any(word in query_lower for word in ['istatistik', 'statistics']):
-        return generate_statistics_summary()
+        return generate_statistics_summary(dataset)
     
     elif any(word in query_lower for word in ['en çok', 'en yüksek', 'maksimum', 'max']):
-        return find_maximum_values()
+        return find_maximum_values(dataset)
     
     elif any(word in query_lower for word in ['en az', 'en düşük', 'minimum', 'min']):
-        return find_minimum_values()
+        return find_minimum_values(dataset)
     
     elif any(word in query_lower for word in ['toplam', 'sum', 'total']):
-        return calculate_totals()
+        return calculate_totals(dataset)
     
     elif any(word in query_lower for word in ['ortalama', 'average', 'mean']):
-        return calculate_averages()
+        return calculate_averages(dataset)
     
     else:
         return f"""
@@ -418,7 +3132,7 @@ Bu sorgu için daha spesifik bilgi verebilmem için lütfen şunları belirtin:
 2. **Nasıl bir analiz türü?** (özet, karşılaştırma, trend, vb.)
 3. **Belirli bir filtreleme kriteri** var mı?
 
-**Mevcut Sütunlar:** {', '.join(data_info['columns'])}
+**Mevcut Sütunlar:** {', '.join(info.columns)}
 
 ### Örnek Sorular:
 - "Satış sütunundaki en yüksek değer nedir?"
@@ -426,44 +3140,526 @@ Bu sorgu için daha spesifik bilgi verebilmem için lütfen şunları belirtin:
 - "2023 verilerini filtrele"
 """
 
-def filter_data(column: str, operator: str, value: Any) -> str:
+FILTER_OPERATORS = ["==", "!=", ">", "<", ">=", "<=", "in", "not_in", "between",
+                    "is_null", "not_null", "contains", "startswith", "endswith"]
+COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le
+}
+STRING_OPERATORS = ["contains", "startswith", "endswith"]
+STRING_MATCH_MODES = ["literal", "regex"]
+LOGICAL_LABELS = {"and": "VE", "or": "VEYA"}
+NUMEXPR_MAX_IN_VALUES = 16
+
+def normalize_filter_expression(expression: Any) -> Dict[str, Any]:
+    """Filtre ifadesini doğrular ve kanonik hale getirir"""
+    if not isinstance(expression, dict):
+        raise ValueError("Filtre ifadesi bir nesne olmalı")
+    
+    for logical in ("and", "or"):
+        if logical in expression:
+            children = expression[logical]
+            if not isinstance(children, list) or not children:
+                raise ValueError(f"'{logical}' boş olmayan bir liste olmalı")
+            return {logical: [normalize_filter_expression(child) for child in children]}
+    
+    if "not" in expression:
+        return {"not": normalize_filter_expression(expression["not"])}
+    
+    if "view" in expression:
+        if not isinstance(expression["view"], str) or not expression["view"]:
+            raise ValueError("'view' kayıtlı bir görünüm adı olmalı")
+        return {"view": expression["view"]}
+    
+    column = expression.get("column")
+    op = expression.get("operator")
+    value = expression.get("value")
+    
+    if not column:
+        raise ValueError("Koşulda 'column' belirtilmeli")
+    if op not in FILTER_OPERATORS:
+        raise ValueError(f"Desteklenmeyen operatör: {op}")
+    if op in ("in", "not_in") and not isinstance(value, list):
+        raise ValueError(f"'{op}' operatörü için değer bir liste olmalı")
+    if op == "between" and (not isinstance(value, list) or len(value) != 2):
+        raise ValueError("'between' operatörü için değer [alt, üst] olmalı")
+    
+    node = {"column": column, "operator": op}
+    if op not in ("is_null", "not_null"):
+        node["value"] = value
+    if op in STRING_OPERATORS:
+        match_mode = expression.get("match_mode", "literal")
+        if match_mode not in STRING_MATCH_MODES:
+            raise ValueError(f"Desteklenmeyen eşleşme modu: {match_mode}")
+        node["match_mode"] = match_mode
+        node["case_sensitive"] = bool(expression.get("case_sensitive", True))
+    return node
+
+def filter_columns(expression: Dict[str, Any]) -> List[str]:
+    """İfadede geçen sütunları döndürür"""
+    if "and" in expression or "or" in expression:
+        children = expression.get("and") or expression.get("or")
+        return sorted({col for child in children for col in filter_columns(child)})
+    if "not" in expression:
+        return filter_columns(expression["not"])
+    if "view" in expression:
+        return []
+    return [expression["column"]]
+
+def describe_filter(expression: Dict[str, Any]) -> str:
+    """İfadeyi okunabilir metne çevirir"""
+    for logical, label in LOGICAL_LABELS.items():
+        if logical in expression:
+            parts = [describe_filter(child) for child in expression[logical]]
+            return parts[0] if len(parts) == 1 else "(" + f" {label} ".join(parts) + ")"
+    if "not" in expression:
+        return f"DEĞİL {describe_filter(expression['not'])}"
+    if "view" in expression:
+        return f"görünüm:{expression['view']}"
+    if "value" not in expression:
+        return f"{expression['column']} {expression['operator']}"
+    description = f"{expression['column']} {expression['operator']} {expression['value']}"
+    if expression['operator'] in STRING_OPERATORS:
+        flags = [] if expression['match_mode'] == "literal" else ["regex"]
+        if not expression['case_sensitive']:
+            flags.append("büyük/küçük harf duyarsız")
+        description += f" [{', '.join(flags)}]" if flags else ""
+    return description
+
+def coerce_filter_value(kind: str, value: Any) -> Any:
+    """Sayısal sütunlarda metin olarak gelen değerleri sayıya çevirir"""
+    if kind in "iuf" and isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"'{value}' sayısal bir değer değil")
+    return value
+
+def build_string_view(values: pd.Series) -> Any:
+    """Sütunu string predicate'ler için Arrow string dizisine çevirir (null'lar korunur)"""
+    if pa is None:
+        return values.astype(str).where(values.notna())
+    
+    # Yalnızca metin sütunları doğrudan Arrow'a aktarılır; sayı, bool ve tarihlerin metin biçimi astype(str) ile aynı kalır
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    if isinstance(dtype, pd.StringDtype) or dtype == object:
+        try:
+            array = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = None
+        if array is not None and pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        if array is not None and (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+            return array
+    return pa.array(values.astype(str).where(values.notna()), type=pa.large_string(), from_pandas=True)
+
+def string_match(view: Any, op: str, pattern: str, match_mode: str, case_sensitive: bool) -> np.ndarray:
+    """contains/startswith/endswith koşulunu metin görünümü üzerinde değerlendirir"""
+    regex = match_mode == "regex"
+    
+    if pa is not None and not isinstance(view, pd.Series):
+        ignore_case = not case_sensitive
+        if op == "contains":
+            matched = (pc.match_substring_regex if regex else pc.match_substring)(view, pattern, ignore_case=ignore_case)
+        elif regex:
+            anchored = f"^(?:{pattern})" if op == "startswith" else f"(?:{pattern})$"
+            matched = pc.match_substring_regex(view, anchored, ignore_case=ignore_case)
+        elif op == "startswith":
+            matched = pc.starts_with(view, pattern, ignore_case=ignore_case)
+        else:
+            matched = pc.ends_with(view, pattern, ignore_case=ignore_case)
+        return np.array(matched.fill_null(False).to_numpy(zero_copy_only=False), dtype=bool)
+    
+    # pyarrow yoksa önceden çevrilmiş str Series üzerinde pandas string metotları
+    if op == "contains":
+        matched = view.str.contains(pattern, case=case_sensitive, regex=regex, na=False)
+    else:
+        if regex:
+            anchored = f"^(?:{pattern})" if op == "startswith" else f"(?:{pattern})$"
+            matched = view.str.contains(anchored, case=case_sensitive, regex=True, na=False)
+        else:
+            text = view if case_sensitive else view.str.lower()
+            pattern = pattern if case_sensitive else pattern.lower()
+            matched = text.str.startswith(pattern, na=False) if op == "startswith" else text.str.endswith(pattern, na=False)
+    return np.array(matched.to_numpy(dtype=bool, na_value=False), dtype=bool)
+
+class CompiledFilter:
+    """Derlenmiş filtre - sayısal koşullar tek numexpr ifadesinde, diğerleri yerinde birleştirilir"""
+    
+    def __init__(self, expression: Dict[str, Any], column_kinds: Dict[str, str]):
+        self.expression = expression
+        self.columns = filter_columns(expression)
+        self._column_kinds = column_kinds
+        self._inputs: Dict[str, str] = {}
+        self._constants: Dict[str, Any] = {}
+        
+        kind, compiled = self._compile(expression)
+        self._evaluate = self._numexpr_function(compiled) if kind == "expr" else compiled
+    
+    def evaluate(self, data: pd.DataFrame, string_view: Optional[Callable[[str], Any]] = None) -> np.ndarray:
+        """Boolean maske döndürür (True: koşulu sağlayan satır)"""
+        if string_view is None:
+            string_views: Dict[str, Any] = {}
+            
+            def string_view(column: str) -> Any:
+                if column not in string_views:
+                    string_views[column] = build_string_view(data[column])
+                return string_views[column]
+        
+        return self._evaluate(data, string_view)
+    
+    def _variable(self, column: str) -> str:
+        for name, col in self._inputs.items():
+            if col == column:
+                return name
+        name = f"c{len(self._inputs)}"
+        self._inputs[name] = column
+        return name
+    
+    def _constant(self, value: Any) -> str:
+        name = f"v{len(self._constants)}"
+        self._constants[name] = value
+        return name
+    
+    def _numexpr_function(self, source: str) -> Callable[..., np.ndarray]:
+        def evaluate(data: pd.DataFrame, string_view: Callable[[str], Any]) -> np.ndarray:
+            local_dict = {name: data[col].to_numpy() for name, col in self._inputs.items()}
+            local_dict.update(self._constants)
+            return numexpr.evaluate(source, local_dict=local_dict)
+        return evaluate
+    
+    def _compile(self, node: Dict[str, Any]) -> Tuple[str, Any]:
+        """Düğümü ('expr', numexpr kaynağı) veya ('func', maske fonksiyonu) olarak derler"""
+        for logical in ("and", "or"):
+            if logical in node:
+                return self._compile_logical(logical, [self._compile(child) for child in node[logical]])
+        
+        if "not" in node:
+            kind, compiled = self._compile(node["not"])
+            if kind == "expr":
+                return "expr", f"~({compiled})"
+            
+            def negate(data: pd.DataFrame, string_view: Callable[[str], Any]) -> np.ndarray:
+                mask = compiled(data, string_view)
+                return np.logical_not(mask, out=mask)
+            return "func", negate
+        
+        return self._compile_leaf(node)
+    
+    def _compile_logical(self, logical: str, children: List[Tuple[str, Any]]) -> Tuple[str, Any]:
+        joiner, combine = (" & ", np.logical_and) if logical == "and" else (" | ", np.logical_or)
+        fragments = [compiled for kind, compiled in children if kind == "expr"]
+        functions = [compiled for kind, compiled in children if kind == "func"]
+        source = "(" + joiner.join(fragments) + ")" if fragments else None
+        
+        if not functions:
+            return "expr", source
+        
+        first = self._numexpr_function(source) if source else functions.pop(0)
+        
+        def evaluate(data: pd.DataFrame, string_view: Callable[[str], Any]) -> np.ndarray:
+            mask = first(data, string_view)
+            for function in functions:
+                combine(mask, function(data, string_view), out=mask)
+            return mask
+        return "func", evaluate
+    
+    def _compile_leaf(self, node: Dict[str, Any]) -> Tuple[str, Any]:
+        column = node["column"]
+        op = node["operator"]
+        kind = self._column_kinds.get(column, "O")
+        value = node.get("value")
+        
+        if op in STRING_OPERATORS:
+            return "func", self._string_leaf(column, op, str(value), node["match_mode"], node["case_sensitive"])
+        
+        if op in ("in", "not_in", "between"):
+            value = [coerce_filter_value(kind, item) for item in value]
+        elif op not in ("is_null", "not_null"):
+            value = coerce_filter_value(kind, value)
+        
+        if numexpr is not None and kind in "iuf":
+            source = self._numexpr_leaf(column, op, value, kind)
+            if source is not None:
+                return "expr", source
+        
+        return "func", self._mask_leaf(column, op, value)
+    
+    def _numexpr_leaf(self, column: str, op: str, value: Any, kind: str) -> Optional[str]:
+        if op in ("in", "not_in") and not 0 < len(value) <= NUMEXPR_MAX_IN_VALUES:
+            return None
+        if op in ("is_null", "not_null") and kind != "f":
+            return None
+        
+        var = self._variable(column)
+        if op in COMPARISON_OPERATORS:
+            return f"({var} {op} {self._constant(value)})"
+        if op == "between":
+            return f"(({var} >= {self._constant(value[0])}) & ({var} <= {self._constant(value[1])}))"
+        if op in ("in", "not_in"):
+            source = "(" + " | ".join(f"({var} == {self._constant(item)})" for item in value) + ")"
+            return source if op == "in" else f"~{source}"
+        # NaN kendisine eşit olmayan tek değerdir
+        return f"({var} != {var})" if op == "is_null" else f"({var} == {var})"
+    
+    def _string_leaf(self, column: str, op: str, pattern: str, match_mode: str,
+                     case_sensitive: bool) -> Callable[..., np.ndarray]:
+        def evaluate(data: pd.DataFrame, string_view: Callable[[str], Any]) -> np.ndarray:
+            return string_match(string_view(column), op, pattern, match_mode, case_sensitive)
+        return evaluate
+    
+    def _mask_leaf(self, column: str, op: str, value: Any) -> Callable[..., np.ndarray]:
+        def evaluate(data: pd.DataFrame, string_view: Callable[[str], Any]) -> np.ndarray:
+            values = data[column]
+            if op in COMPARISON_OPERATORS:
+                result = COMPARISON_OPERATORS[op](values, value)
+            elif op == "in":
+                result = values.isin(value)
+            elif op == "not_in":
+                result = ~values.isin(value)
+            elif op == "between":
+                result = values.between(value[0], value[1])
+            elif op == "is_null":
+                result = values.isna()
+            else:
+                result = values.notna()
+            return np.array(result.to_numpy(dtype=bool, na_value=False), dtype=bool, copy=True)
+        return evaluate
+
+@lru_cache(maxsize=256)
+def _compile_filter_cached(expression_key: str, kinds_key: Tuple[Tuple[str, str], ...]) -> CompiledFilter:
+    return CompiledFilter(json.loads(expression_key), dict(kinds_key))
+
+def compile_filter(expression: Dict[str, Any], data: pd.DataFrame) -> CompiledFilter:
+    """İfadeyi sütun tiplerine göre derler; aynı ifade ve şema için derleme tekrar kullanılır"""
+    columns = filter_columns(expression)
+    missing = [col for col in columns if col not in data.columns]
+    if missing:
+        raise KeyError(missing[0])
+    
+    kinds = tuple((col, data[col].dtype.kind if isinstance(data[col].dtype, np.dtype) else "O") for col in columns)
+    return _compile_filter_cached(json.dumps(expression, sort_keys=True, default=str), kinds)
+
+def take_string_view(view: Any, positions: np.ndarray) -> Any:
+    """Metin görünümünden verilen satırları seçer"""
+    if isinstance(view, pd.Series):
+        return view.iloc[positions]
+    return view.take(pa.array(positions))
+
+def slice_string_view(view: Any, start: int, end: int) -> Any:
+    """Metin görünümünün [start, end) satır aralığını kopyasız döndürür"""
+    if isinstance(view, pd.Series):
+        return view.iloc[start:end]
+    return view.slice(start, end - start)
+
+def evaluate_filter_blocks(dataset: DatasetEntry, expression: Dict[str, Any], data: pd.DataFrame,
+                           blocks: np.ndarray) -> np.ndarray:
+    """Filtreyi yalnızca zone map'in eleyemediği ardışık blok aralıklarında değerlendirir"""
+    block_rows = dataset.zone_map.block_rows
+    compiled = compile_filter(expression, data)
+    # Ardışık aday bloklar tek aralıkta birleştirilir; dilimler kopya değil görünümdür
+    edges = np.diff(np.concatenate(([0], blocks.view(np.int8), [0])))
+    runs = zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+    logger.info(f"Zone map: {int(blocks.sum())}/{len(blocks)} blok taranıyor")
+    
+    selections = [np.empty(0, dtype=np.int64)]
+    for first, last in runs:
+        check_cancelled()
+        start, end = int(first) * block_rows, min(int(last) * block_rows, len(data))
+        part = data.iloc[start:end]
+        
+        def part_view(column: str) -> Any:
+            return slice_string_view(dataset.string_view(column), start, end)
+        
+        selections.append(np.flatnonzero(compiled.evaluate(part, part_view)) + start)
+    return np.concatenate(selections)
+
+def evaluate_filter(dataset: DatasetEntry, expression: Dict[str, Any]) -> np.ndarray:
+    """Filtreyi değerlendirip eşleşen satır pozisyonlarını (artan sırada) döndürür"""
+    data = dataset.frame(filter_columns(expression))
+    blocks = dataset.zone_map.candidates(expression) if dataset.zone_map is not None else None
+    if blocks is not None and not blocks.any():
+        # Hiçbir bloğun min/max aralığı koşulu sağlayamaz; indeks de tarama da gerekmez
+        return np.empty(0, dtype=np.int64)
+    conditions = expression["and"] if "and" in expression else [expression]
+    
+    # AND içindeki en seçici indeksli koşul aday satırları verir; kalanlar sadece adaylarda değerlendirilir
+    best = None
+    for condition in conditions:
+        if condition.get("operator") not in INDEXABLE_OPERATORS:
+            continue
+        index = dataset.index_for(condition["column"])
+        if index is None:
+            continue
+        
+        kind = data[condition["column"]].dtype.kind
+        value = condition["value"]
+        value = [coerce_filter_value(kind, item) for item in value] if isinstance(value, list) else coerce_filter_value(kind, value)
+        bounds = index.bounds(condition["operator"], value)
+        size = sum(end - start for start, end in bounds)
+        if best is None or size < best[0]:
+            best = (size, condition, index, bounds)
+    
+    positions = None
+    remaining = conditions
+    if best is not None:
+        _, condition, index, bounds = best
+        positions = index.lookup(bounds, presorted=condition["operator"] == "==")
+        remaining = [other for other in conditions if other is not condition]
+    
+    if positions is None:
+        if blocks is not None and not blocks.all():
+            return evaluate_filter_blocks(dataset, expression, data, blocks)
+        return np.flatnonzero(compile_filter(expression, data).evaluate(data, dataset.string_view))
+    
+    if remaining and len(positions) > 0:
+        rest = remaining[0] if len(remaining) == 1 else {"and": remaining}
+        candidates = data[filter_columns(rest)].take(positions)
+        
+        def candidate_view(column: str) -> Any:
+            return take_string_view(dataset.string_view(column), positions)
+        
+        positions = positions[compile_filter(rest, candidates).evaluate(candidates, candidate_view)]
+    
+    return positions
+
+def scan_filter(partitions: PartitionedDataset, expression: Dict[str, Any], limit: int,
+                collect: bool = False) -> Tuple[int, pd.DataFrame, Optional[np.ndarray]]:
+    """Filtreyi parçalar üzerinde değerlendirir; eşleşme sayısı, ilk satırlar ve istenirse tüm pozisyonlar döner"""
+    columns = filter_columns(expression)
+    match_count = 0
+    heads: List[pd.DataFrame] = []
+    selections: List[np.ndarray] = [np.empty(0, dtype=np.int64)]
+    shown = 0
+    
+    parts = None
+    if partitions.zone_map is not None:
+        candidates = partitions.zone_map.candidates(expression)
+        if candidates is not None:
+            # Min/max aralığı koşulla kesişmeyen parçalar diskten hiç okunmaz
+            parts = np.flatnonzero(candidates)
+            logger.info(f"Zone map: {len(parts)}/{len(partitions.files)} parça taranıyor")
+    
+    for index, part in partitions.scan(columns, parts):
+        positions = np.flatnonzero(compile_filter(expression, part).evaluate(part))
+        match_count += len(positions)
+        if collect:
+            selections.append(positions + partitions.part_starts[index])
+        if shown < limit and len(positions) > 0:
+            # Tüm sütunlar yalnızca gösterilecek satırlar için okunur
+            heads.append(partitions.read_part(index).take(positions[:limit - shown]))
+            shown += len(heads[-1])
+    
+    head = pd.concat(heads, ignore_index=True) if heads else partitions.schema
+    return match_count, head, np.concatenate(selections) if collect else None
+
+def has_view_reference(expression: Any) -> bool:
+    """İfadede kayıtlı görünüm referansı ({"view": ad}) olup olmadığını döndürür"""
+    if not isinstance(expression, dict):
+        return False
+    if "view" in expression:
+        return True
+    children = expression.get("and") or expression.get("or") or [expression.get("not")]
+    return isinstance(children, list) and any(has_view_reference(child) for child in children)
+
+def view_selection(dataset: DatasetEntry, name: str) -> SelectionBitmap:
+    """Kayıtlı görünümün seçimini filtrelenen veri setinin satırlarına göre döndürür"""
+    view = registry.get(name)
+    if not isinstance(view, DatasetView):
+        raise ValueError(f"'{name}' kayıtlı bir görünüm değil")
+    root = dataset.base if isinstance(dataset, DatasetView) else dataset
+    if view.base is not root:
+        raise ValueError(f"'{name}' görünümü '{root.name}' veri setine ait değil")
+    if dataset is root:
+        return view.bitmap
+    # Görünüm üzerinde filtrelemede seçim, görünümün kendi satır numaralarına çevrilir
+    return SelectionBitmap.from_mask(view.bitmap.contains(dataset.selection))
+
+def evaluate_selection(dataset: DatasetEntry, expression: Dict[str, Any]) -> SelectionBitmap:
+    """İfadeyi sıkıştırılmış seçim olarak değerlendirir; görünüm referansları bitmap işlemleriyle birleştirilir"""
+    if not has_view_reference(expression):
+        # Görünüm içermeyen alt ifade tek derlenmiş geçişte değerlendirilir
+        if dataset.partitions is not None:
+            _, _, positions = scan_filter(dataset.partitions, expression, 0, collect=True)
+        else:
+            positions = evaluate_filter(dataset, expression)
+        return SelectionBitmap.from_positions(positions, dataset.info.shape[0])
+    if "view" in expression:
+        return view_selection(dataset, expression["view"])
+    if "not" in expression:
+        return ~evaluate_selection(dataset, expression["not"])
+    
+    logical = "and" if "and" in expression else "or"
+    children = expression[logical]
+    plain = [child for child in children if not has_view_reference(child)]
+    # Görünümsüz kardeş koşullar ayrı ayrı değil, birlikte tek geçişte değerlendirilir
+    operands = [child for child in children if has_view_reference(child)]
+    if plain:
+        operands.append(plain[0] if len(plain) == 1 else {logical: plain})
+    
+    result = None
+    for operand in operands:
+        selection = evaluate_selection(dataset, operand)
+        result = selection if result is None else (result & selection if logical == "and" else result | selection)
+    return result
+
+def filter_data(dataset: DatasetEntry, column: Optional[str], operator: Optional[str], value: Any,
+                expression: Optional[Dict[str, Any]] = None, save_as: Optional[str] = None) -> str:
     """Veri filtreleme"""
+    info = dataset.info
+    
     try:
-        if column not in current_data.columns:
-            return f"❌ '{column}' sütunu bulunamadı!"
-        
-        if operator == "==":
-            filtered_data = current_data[current_data[column] == value]
-        elif operator == "!=":
-            filtered_data = current_data[current_data[column] != value]
-        elif operator == ">":
-            filtered_data = current_data[current_data[column] > value]
-        elif operator == "<":
-            filtered_data = current_data[current_data[column] < value]
-        elif operator == ">=":
-            filtered_data = current_data[current_data[column] >= value]
-        elif operator == "<=":
-            filtered_data = current_data[current_data[column] <= value]
-        elif operator == "contains":
-            filtered_data = current_data[current_data[column].astype(str).str.contains(str(value), na=False)]
-        elif operator == "startswith":
-            filtered_data = current_data[current_data[column].astype(str).str.startswith(str(value), na=False)]
-        elif operator == "endswith":
-            filtered_data = current_data[current_data[column].astype(str).str.endswith(str(value), na=False)]
+        if save_as and save_as in (dataset.name, getattr(dataset, 'base', dataset).name):
+            return f"❌ Görünüm adı filtrelenen veri setiyle aynı olamaz: {save_as}"
+        
+        if expression is None:
+            expression = {"column": column, "operator": operator, "value": value}
+        expression = normalize_filter_expression(expression)
+        
+        for col in filter_columns(expression):
+            if col not in info.columns:
+                return f"❌ '{col}' sütunu bulunamadı!"
+        
+        selection = None
+        if has_view_reference(expression):
+            selection = evaluate_selection(dataset, expression)
+            match_count = selection.count()
+            head = dataset.take(selection.head(10))
+        elif dataset.partitions is not None:
+            match_count, head, positions = scan_filter(dataset.partitions, expression, 10, collect=bool(save_as))
         else:
-            return f"❌ Desteklenmeyen operatör: {operator}"
+            # Filtrelenmiş kopya yerine sadece gösterilecek satırlar alınır
+            positions = evaluate_filter(dataset, expression)
+            match_count = len(positions)
+            head = dataset.take(positions[:10])
+        
+        saved = ""
+        if save_as:
+            # Sonuç kopyalanmaz; yalnızca sıkıştırılmış satır seçimi isimli görünüm olarak saklanır
+            if selection is None:
+                selection = SelectionBitmap.from_positions(positions, info.shape[0])
+            view = DatasetView(save_as, dataset, selection, expression)
+            registry.register(view, activate=False)
+            saved = (f"**Görünüm:** '{save_as}' olarak kaydedildi ({view.bitmap.nbytes / 1024:,.1f} KB sıkıştırılmış seçim); "
+                     f"diğer araçlarda dataset='{save_as}' ile kullanılabilir\n")
         
         result = f"""
 ## 🔍 Filtreleme Sonucu
 
-**Filtre:** {column} {operator} {value}
-**Sonuç:** {len(filtered_data)} satır bulundu (Toplam: {len(current_data)})
-
+**Filtre:** {describe_filter(expression)}
+**Sonuç:** {match_count} satır bulundu (Toplam: {info.shape[0]})
+{saved}
 ### İlk 10 Sonuç:
 """
         
-        if len(filtered_data) > 0:
-            result += filtered_data.head(10).to_string(index=False)
+        if match_count > 0:
+            result += head.to_string(index=False)
         else:
             result += "Hiç sonuç bulunamadı."
         
@@ -472,165 +3668,492 @@ def filter_data(column: str, operator: str, value: Any) -> str:
     except Exception as e:
         return f"❌ Filtreleme hatası: {str(e)}"
 
-def calculate_statistics(columns: List[str], operation: str) -> str:
+STATISTIC_OPERATIONS = ["mean", "median", "sum", "min", "max", "std", "var", "count", "distinct_count"]
+SUMMARY_STATISTICS = ["count", "sum", "mean", "std", "min", "max", "argmin", "argmax", "q25", "median", "q75"]
+SKETCH_QUANTILES = {"q25": 0.25, "median": 0.5, "q75": 0.75}
+
+def exact_integer_sum(array: np.ndarray) -> int:
+    """Tamsayı dizisinin taşmasız, tam toplamı: üst ve alt 32 bit ayrı toplanır"""
+    wide = np.uint64 if array.dtype.kind == 'u' else np.int64
+    array = array.astype(wide, copy=False)
+    high = int((array >> 32).sum(dtype=wide))
+    low = int((array & 0xFFFFFFFF).sum(dtype=wide))
+    return high * (1 << 32) + low
+
+def column_statistics(values: pd.Series, operations: List[str]) -> Dict[str, Any]:
+    """Tek sütunun istatistikleri; tamsayı sütunlarda sum/min/max kendi tipinde (tam) hesaplanır"""
+    needed = set(operations)
+    mask = values.notna().to_numpy()
+    has_missing = not mask.all()
+    if values.dtype.kind in "iu":
+        integer = True
+        present = values[mask] if has_missing else values
+        array = present.to_numpy(dtype=np.uint64 if values.dtype.kind == 'u' else np.int64)
+    else:
+        integer = False
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        if has_missing:
+            array = array[mask]
+    count = len(array)
+    
+    results: Dict[str, Any] = {"count": float(count)}
+    if count == 0:
+        # Tamamen boş sütun: toplam 0, konumlar -1, diğerleri NaN
+        results.update({operation: np.nan for operation in needed - {"count"}})
+        results.update({operation: value for operation, value in
+                        (("sum", 0.0), ("argmin", -1.0), ("argmax", -1.0)) if operation in needed})
+        return results
+    
+    # Satır pozisyonları: eksik değerler atlandıysa özgün sıraya geri eşlenir
+    positions = np.flatnonzero(mask) if has_missing else None
+    for name, search in (("argmin", np.argmin), ("argmax", np.argmax)):
+        if name in needed:
+            position = int(search(array))
+            results[name] = float(position if positions is None else positions[position])
+    if "min" in needed:
+        results["min"] = array.min().item()
+    if "max" in needed:
+        results["max"] = array.max().item()
+    
+    quantiles = [(name, q) for name, q in (("q25", 25), ("median", 50), ("q75", 75)) if name in needed]
+    if quantiles:
+        # Tüm çeyrekler tek percentile çağrısıyla (tek bölümleme) hesaplanır
+        for (name, _), value in zip(quantiles, np.percentile(array, [q for _, q in quantiles])):
+            results[name] = float(value)
+    
+    if needed & {"sum", "mean", "std", "var"}:
+        total = exact_integer_sum(array) if integer else float(array.sum())
+        results["sum"] = total
+        mean = total / count
+        results["mean"] = float(mean)
+        if needed & {"std", "var"}:
+            # İki geçişli varyans: ortalamadan sapmalar yalnızca bu sütun için geçici dizide tutulur
+            deviations = np.subtract(array, mean, dtype=np.float64)
+            var = float(np.dot(deviations, deviations) / (count - 1)) if count > 1 else np.nan
+            results["var"] = var
+            results["std"] = float(np.sqrt(var))
+    return results
+
+def statistics_frame(rows: List[Dict[str, Any]], columns: List[str], operations: List[str]) -> pd.DataFrame:
+    """Sütun istatistiklerini tabloya çevirir; tam tamsayı sonuçlar float'a zorlanmaz"""
+    frame = {}
+    for operation in operations:
+        values = [row[operation] for row in rows]
+        # Tamsayı ve float karışık sütunda pandas float64'e çevirirdi; büyük tamsayılar object olarak korunur
+        exact = any(isinstance(value, int) and abs(value) > 2 ** 53 for value in values)
+        frame[operation] = pd.Series(values, index=columns, dtype=object if exact else np.float64)
+    return pd.DataFrame(frame, index=columns)
+
+def compute_column_statistics(data: pd.DataFrame, columns: List[str], operations: List[str]) -> pd.DataFrame:
+    """Tüm işlemleri sütun sütun hesaplar; bellekte aynı anda yalnızca bir sütunun geçici kopyası bulunur"""
+    rows = []
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for col in columns:
+            check_cancelled()
+            rows.append(column_statistics(data[col], operations))
+    return statistics_frame(rows, columns, operations)
+
+MERGEABLE_STATISTICS = ["count", "sum", "mean", "var", "min", "max"]
+
+def merge_extreme(left: pd.Series, right: pd.Series, smaller: bool) -> pd.Series:
+    """NaN'ları atlayarak eleman bazında min/max; tam tamsayı (object) sütunlarda da çalışır"""
+    better = right < left if smaller else right > left
+    return left.where(left.notna() & ~better, right)
+
+def merge_statistics_partials(left: Optional[pd.DataFrame], right: pd.DataFrame) -> pd.DataFrame:
+    """count/sum/mean/var/min/max kısmi sonuçlarını birleştirir (Chan paralel varyans formülü)"""
+    if left is None:
+        return right
+    
+    count_left, count_right = left["count"], right["count"]
+    count = count_left + count_right
+    mean_left, mean_right = left["mean"].fillna(0.0), right["mean"].fillna(0.0)
+    # M2 = var * (n - 1); tek satırlı veya boş parçalarda 0
+    m2_left = (left["var"] * (count_left - 1)).where(count_left > 1, 0.0)
+    m2_right = (right["var"] * (count_right - 1)).where(count_right > 1, 0.0)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = mean_right - mean_left
+        mean = (mean_left + delta * count_right / count).where(count > 0, np.nan)
+        m2 = m2_left + m2_right + (delta ** 2 * count_left * count_right / count).where(count > 0, 0.0)
+        var = (m2 / (count - 1)).where(count > 1, np.nan)
+    
+    return pd.DataFrame({
+        "count": count,
+        # Toplamlar doğrudan eklenir; tamsayı sütunlarda tam kalır
+        "sum": left["sum"] + right["sum"],
+        "mean": mean,
+        "var": var,
+        "min": merge_extreme(left["min"], right["min"], smaller=True),
+        "max": merge_extreme(left["max"], right["max"], smaller=False)
+    })
+
+def finalize_statistics_partials(merged: pd.DataFrame) -> pd.DataFrame:
+    """Birleştirilmiş kısmi sonuçlardan std türetir"""
+    merged["std"] = np.sqrt(merged["var"].astype(np.float64))
+    return merged
+
+def parallel_column_statistics(data: pd.DataFrame, columns: List[str], operations: List[str]) -> pd.DataFrame:
+    """Büyük tablolarda kısmi istatistikleri satır bloklarında paralel hesaplayıp birleştirir"""
+    blocks = row_blocks(len(data))
+    if len(blocks) == 1:
+        return compute_column_statistics(data, columns, operations)
+    
+    def block_statistics(bounds: Tuple[int, int]) -> pd.DataFrame:
+        return compute_column_statistics(data.iloc[bounds[0]:bounds[1]], columns, MERGEABLE_STATISTICS)
+    
+    merged = None
+    for partial in parallel_map(block_statistics, blocks):
+        merged = merge_statistics_partials(merged, partial)
+    merged = finalize_statistics_partials(merged)
+    
+    exact_operations = [operation for operation in operations if operation not in merged.columns]
+    if exact_operations:
+        # Çeyrekler ve argmin/argmax birleştirilemez; sütunlar paralel ve tam olarak hesaplanır
+        def column_exact(col: str) -> pd.DataFrame:
+            return compute_column_statistics(data, [col], exact_operations)
+        merged = merged.join(pd.concat(parallel_map(column_exact, columns)))
+    return merged[operations]
+
+def scan_column_statistics(dataset: DatasetEntry, columns: List[str], operations: List[str]) -> pd.DataFrame:
+    """İstatistikleri parça parça hesaplayıp kısmi sonuçları birleştirir"""
+    def part_statistics(part: pd.DataFrame) -> pd.DataFrame:
+        return compute_column_statistics(part, columns, MERGEABLE_STATISTICS)
+    
+    merged = None
+    for partial in dataset.partitions.map_parts(part_statistics, columns):
+        merged = merge_statistics_partials(merged, partial)
+    
+    return finalize_statistics_partials(merged)[operations]
+
+def column_sketches(dataset: DatasetEntry, columns: List[str]) -> Dict[str, ColumnSketch]:
+    """Sütun taslaklarını profilden veya out-of-core parçalarından getirir"""
+    if dataset.partitions is not None:
+        sketches = dataset.partitions.column_sketches(columns)
+        dataset.info.preset('sketch', sketches)
+        return sketches
+    return {col: dataset.info.sketch(col) for col in columns}
+
+def sketch_column_statistics(dataset: DatasetEntry, columns: List[str], operations: List[str]) -> pd.DataFrame:
+    """median (KLL) ve distinct_count (HyperLogLog) işlemlerini sütun taslaklarından yaklaşık hesaplar"""
+    sketches = column_sketches(dataset, columns)
+    results: Dict[str, List[float]] = {}
+    if "median" in operations:
+        results["median"] = [sketches[col].quantiles.quantiles([0.5])[0] if sketches[col].quantiles is not None
+                             else np.nan for col in columns]
+    if "distinct_count" in operations:
+        results["distinct_count"] = [round(sketches[col].distinct.estimate()) for col in columns]
+    return pd.DataFrame(results, index=columns)
+
+def format_statistic(operation: str, value: float) -> str:
+    """İstatistik değerini biçimlendirir; taslak sayımları tam sayı ve yaklaşık gösterilir"""
+    if operation == "distinct_count":
+        return f"~{value:,.0f}"
+    return f"{value:,.2f}"
+
+def calculate_statistics(dataset: DatasetEntry, columns: List[str], operations: List[str],
+                         approximate: Optional[bool] = None) -> str:
     """İstatistik hesaplama"""
+    info = dataset.info
+    
     try:
+        unsupported = [operation for operation in operations if operation not in STATISTIC_OPERATIONS]
+        if unsupported:
+            return f"❌ Desteklenmeyen işlem: {', '.join(unsupported)}"
+        
+        # Farklı değer sayımı her tipte sütunda çalışır; diğer işlemler sayısal sütun ister
+        distinct_only = set(operations) == {"distinct_count"}
+        
         if not columns:
-            columns = data_info['numeric_columns']
+            columns = info.columns if distinct_only else info.numeric_columns
         
         if not columns:
             return "❌ Sayısal sütun bulunamadı!"
         
-        result = f"## 📈 İstatistik Sonuçları ({operation.upper()})\n\n"
+        result = f"## 📈 İstatistik Sonuçları ({', '.join(operation.upper() for operation in operations)})\n\n"
         
+        valid_columns = []
         for col in columns:
-            if col not in current_data.columns:
+            if col not in info.columns:
                 result += f"❌ '{col}' sütunu bulunamadı!\n"
-                continue
-            
-            if col not in data_info['numeric_columns']:
+            elif col not in info.numeric_columns and not distinct_only:
                 result += f"⚠️ '{col}' sayısal bir sütun değil!\n"
-                continue
-            
-            if operation == "mean":
-                value = current_data[col].mean()
-            elif operation == "median":
-                value = current_data[col].median()
-            elif operation == "sum":
-                value = current_data[col].sum()
-            elif operation == "min":
-                value = current_data[col].min()
-            elif operation == "max":
-                value = current_data[col].max()
-            elif operation == "std":
-                value = current_data[col].std()
-            elif operation == "var":
-                value = current_data[col].var()
-            elif operation == "count":
-                value = current_data[col].count()
             else:
-                result += f"❌ Desteklenmeyen işlem: {operation}\n"
-                continue
-            
-            result += f"**{col}:** {value:,.2f}\n"
+                valid_columns.append(col)
+        
+        if not valid_columns:
+            return result
+        
+        # Out-of-core parçalarda kesin medyan için tam sıralama yapılamaz; taslak her zaman kullanılır
+        if dataset.partitions is not None or approximate is None:
+            approximate = dataset.partitions is not None or info.approximate_quantiles
+        sketched = [operation for operation in operations
+                    if operation == "distinct_count" or (approximate and operation == "median")]
+        exact = [operation for operation in operations if operation not in sketched]
+        
+        check_cancelled()
+        frames = []
+        if exact:
+            if dataset.partitions is not None:
+                frames.append(scan_column_statistics(dataset, valid_columns, exact))
+            else:
+                frames.append(parallel_column_statistics(dataset.frame(valid_columns), valid_columns, exact))
+        if sketched:
+            frames.append(sketch_column_statistics(dataset, valid_columns, sketched))
+            methods = {"median": "KLL kantil taslağı",
+                       "distinct_count": f"HyperLogLog, ~%{104 / np.sqrt(1 << HLL_PRECISION):.1f} standart hata"}
+            result += "ℹ️ Taslaklardan yaklaşık hesaplandı: " + ", ".join(
+                f"{operation.upper()} ({methods[operation]})" for operation in sketched) + "\n\n"
+        stats = pd.concat(frames, axis=1)[operations]
+        
+        if len(operations) == 1:
+            for col, value in stats[operations[0]].items():
+                result += f"**{col}:** {format_statistic(operations[0], value)}\n"
+            return result
+        
+        result += "| Sütun | " + " | ".join(operation.upper() for operation in operations) + " |\n"
+        result += "|---|" + "---:|" * len(operations) + "\n"
+        for col, row in stats.iterrows():
+            result += f"| {col} | " + " | ".join(format_statistic(operation, row[operation]) for operation in operations) + " |\n"
         
         return result
         
     except Exception as e:
         return f"❌ İstatistik hesaplama hatası: {str(e)}"
 
-def group_analysis(group_by: str, agg_column: str = None, agg_function: str = "count") -> str:
+GROUP_AGGREGATIONS = ["sum", "mean", "count", "min", "max"]
+
+def format_group_value(value: Any) -> str:
+    """Agregasyon sonucunu biçimlendirir"""
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        return f"{value:,.2f}"
+    return str(value)
+
+def select_top_groups(values: np.ndarray, top_n: int, order: str) -> np.ndarray:
+    """En büyük (desc) veya en küçük (asc) N grubu kısmi sıralamayla seçer"""
+    if values.dtype.kind in "iufb":
+        keys = values.astype(np.float64)
+    else:
+        # Sayısal olmayan sonuçlar sıralı kodlara çevrilir
+        codes, _ = pd.factorize(values, sort=True)
+        keys = np.where(codes < 0, np.nan, codes.astype(np.float64))
+    if order == "desc":
+        keys = -keys
+    # Eksik sonuçlar her iki yönde de sona kalır
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    
+    top_n = min(top_n, len(keys))
+    if top_n <= 0:
+        return np.empty(0, dtype=np.intp)
+    # argpartition O(n); yalnızca seçilen N grup sıralanır
+    candidates = np.argpartition(keys, top_n - 1)[:top_n] if top_n < len(keys) else np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind='stable')]
+
+def merge_group_partials(merged: Optional[pd.DataFrame], partials: List[pd.DataFrame],
+                         merge_functions: Dict[str, str]) -> Optional[pd.DataFrame]:
+    """Parça bazlı grup kısmi sonuçlarını anahtarlara göre birleştirir"""
+    frames = ([merged] if merged is not None else []) + partials
+    if not frames:
+        return merged
+    combined = pd.concat(frames)
+    return combined.groupby(level=list(range(combined.index.nlevels)), sort=False).agg(merge_functions)
+
+def scan_group_aggregates(partitions: PartitionedDataset, group_by: List[str],
+                          aggregations: List[Tuple[Optional[str], str]]) -> Tuple[pd.DataFrame, List[np.ndarray]]:
+    """Gruplamayı parça parça yapar; kısmi toplamlar (sum/count/min/max/size) sonda birleştirilir"""
+    # mean birleştirilebilir değildir: sum ve count olarak taşınır
+    partial_specs: Dict[str, Tuple[str, str]] = {}
+    for agg_column, agg_function in aggregations:
+        if agg_column:
+            for function in (("sum", "count") if agg_function == "mean" else (agg_function,)):
+                partial_specs[f"{function}:{agg_column}"] = (agg_column, function)
+    merge_functions = {name: ("sum" if function in ("sum", "count") else function)
+                       for name, (_, function) in partial_specs.items()}
+    merge_functions["size"] = "sum"
+    columns = list(dict.fromkeys(group_by + [column for column, _ in partial_specs.values()]))
+    
+    def part_aggregates(part: pd.DataFrame) -> pd.DataFrame:
+        grouped = part.groupby(group_by, sort=False, observed=True)
+        partial = grouped.size().rename("size").to_frame()
+        if partial_specs:
+            partial = grouped.agg(**{name: pd.NamedAgg(column=column, aggfunc=function)
+                                     for name, (column, function) in partial_specs.items()}).join(partial)
+        return partial
+    
+    merged = None
+    pending: List[pd.DataFrame] = []
+    for partial in partitions.map_parts(part_aggregates, columns):
+        pending.append(partial)
+        # Bellek, parça sayısıyla değil grup sayısıyla sınırlı kalsın diye kısmi sonuçlar aralıklarla birleştirilir
+        if len(pending) >= GROUP_MERGE_BATCH:
+            merged = merge_group_partials(merged, pending, merge_functions)
+            pending = []
+    merged = merge_group_partials(merged, pending, merge_functions).sort_index()
+    
+    results = []
+    for agg_column, agg_function in aggregations:
+        if not agg_column:
+            results.append(merged["size"].to_numpy())
+        elif agg_function == "mean":
+            with np.errstate(invalid='ignore', divide='ignore'):
+                results.append((merged[f"sum:{agg_column}"] / merged[f"count:{agg_column}"]).to_numpy(dtype=np.float64))
+        else:
+            results.append(merged[f"{agg_function}:{agg_column}"].to_numpy())
+    return merged.index.to_frame(index=False), results
+
+def group_analysis(dataset: DatasetEntry, group_by: List[str], aggregations: List[Tuple[Optional[str], str]],
+                   top_n: Optional[int] = None, order: str = "desc") -> str:
     """Grup analizi"""
+    columns = dataset.info.columns
+    
     try:
-        if group_by not in current_data.columns:
-            return f"❌ '{group_by}' sütunu bulunamadı!"
-        
-        if agg_column and agg_column not in current_data.columns:
-            return f"❌ '{agg_column}' sütunu bulunamadı!"
+        for col in group_by:
+            if col not in columns:
+                return f"❌ '{col}' sütunu bulunamadı!"
         
-        if agg_column:
-            if agg_function == "sum":
-                grouped = current_data.groupby(group_by)[agg_column].sum()
-            elif agg_function == "mean":
-                grouped = current_data.groupby(group_by)[agg_column].mean()
-            elif agg_function == "count":
-                grouped = current_data.groupby(group_by)[agg_column].count()
-            elif agg_function == "min":
-                grouped = current_data.groupby(group_by)[agg_column].min()
-            elif agg_function == "max":
-                grouped = current_data.groupby(group_by)[agg_column].max()
-            else:
+        for agg_column, agg_function in aggregations:
+            if agg_column and agg_column not in columns:
+                return f"❌ '{agg_column}' sütunu bulunamadı!"
+            if agg_function not in GROUP_AGGREGATIONS:
                 return f"❌ Desteklenmeyen agregasyon fonksiyonu: {agg_function}"
+        
+        if dataset.partitions is not None:
+            keys, results = scan_group_aggregates(dataset.partitions, group_by, aggregations)
+            ngroups = len(keys)
+        else:
+            data = dataset.frame(list(dict.fromkeys(group_by + [col for col, _ in aggregations if col])))
+            grouping = dataset.grouping(group_by)
+            ngroups = grouping.ngroups
+            
+            results = []
+            for agg_column, agg_function in aggregations:
+                check_cancelled()
+                if agg_column:
+                    results.append(grouping.aggregate(data[agg_column], agg_function))
+                else:
+                    # Sütun verilmezse grup boyutu sayılır
+                    results.append(grouping.sizes)
+        
+        if top_n:
+            # Sıralama ilk agregasyona göre yapılır
+            groups = select_top_groups(results[0], top_n, order)
+            first_column, first_function = aggregations[0]
+            ranking = (f"**Sıralama:** {'en yüksek' if order == 'desc' else 'en düşük'} {len(groups)} grup "
+                       f"({f'{first_function}({first_column})' if first_column else 'count'})\n")
         else:
-            grouped = current_data.groupby(group_by).size()
-            agg_function = "count"
+            groups = np.arange(min(ngroups, 20))
+            ranking = ""
+        labels = format_group_labels(keys.iloc[groups]) if dataset.partitions is not None else grouping.labels(data, groups)
         
-        result = f"""
+        if len(aggregations) == 1:
+            agg_column, agg_function = aggregations[0]
+            result = f"""
 ## 📊 Grup Analizi
 
-**Gruplama:** {group_by}
+**Gruplama:** {', '.join(group_by)}
 **Agregasyon:** {agg_function}
 {f"**Sütun:** {agg_column}" if agg_column else ""}
+{ranking}
+### Sonuçlar:
+"""
+            for label, group in zip(labels, groups):
+                result += f"- **{label}:** {format_group_value(results[0][group])}\n"
+        else:
+            headers = [f"{agg_function}({agg_column})" if agg_column else "count" for agg_column, agg_function in aggregations]
+            result = f"""
+## 📊 Grup Analizi
 
+**Gruplama:** {', '.join(group_by)}
+**Agregasyonlar:** {', '.join(headers)}
+{ranking}
 ### Sonuçlar:
+
+| {' / '.join(group_by)} | {' | '.join(headers)} |
+|---|{'---:|' * len(headers)}
 """
+            for label, group in zip(labels, groups):
+                result += f"| {label} | " + " | ".join(format_group_value(values[group]) for values in results) + " |\n"
         
-        for group, value in grouped.head(20).items():
-            result += f"- **{group}:** {value:,.2f}\n"
-        
-        if len(grouped) > 20:
-            result += f"\n... ve {len(grouped) - 20} grup daha"
+        if ngroups > len(groups):
+            result += f"\n... ve {ngroups - len(groups)} grup daha"
         
         return result
         
     except Exception as e:
         return f"❌ Grup analizi hatası: {str(e)}"
 
-def generate_statistics_summary() -> str:
+def format_row_position(position: float) -> str:
+    """Satır pozisyonunu 1 tabanlı satır numarasına çevirir"""
+    return "-" if np.isnan(position) or position < 0 else str(int(position) + 1)
+
+def generate_statistics_summary(dataset: DatasetEntry) -> str:
     """İstatistik özeti"""
-    if not data_info['numeric_columns']:
+    info = dataset.info
+    
+    if not info.numeric_columns:
         return "❌ Sayısal sütun bulunamadı!"
     
     result = "## 📈 İstatistiksel Özet\n\n"
     
-    for col in data_info['numeric_columns']:
-        stats = current_data[col].describe()
+    for col, stats in info.summaries().items():
         result += f"### {col}\n"
         result += f"- **Ortalama:** {stats['mean']:.2f}\n"
-        result += f"- **Medyan:** {stats['50%']:.2f}\n"
+        result += f"- **Medyan{' (yaklaşık)' if info.approximate_quantiles else ''}:** {stats['median']:.2f}\n"
         result += f"- **Standart Sapma:** {stats['std']:.2f}\n"
         result += f"- **Min:** {stats['min']:.2f}\n"
         result += f"- **Max:** {stats['max']:.2f}\n\n"
     
     return result
 
-def find_maximum_values() -> str:
+def find_maximum_values(dataset: DatasetEntry) -> str:
     """En yüksek değerleri bulur"""
-    if not data_info['numeric_columns']:
+    info = dataset.info
+    
+    if not info.numeric_columns:
         return "❌ Sayısal sütun bulunamadı!"
     
     result = "## 🔝 En Yüksek Değerler\n\n"
-    for col in data_info['numeric_columns']:
-        max_val = current_data[col].max()
-        max_idx = current_data[col].idxmax()
-        result += f"**{col}:** {max_val:,.2f} (Satır: {max_idx + 1})\n"
+    for col, stats in info.summaries().items():
+        result += f"**{col}:** {stats['max']:,.2f} (Satır: {format_row_position(stats['argmax'])})\n"
     
     return result
 
-def find_minimum_values() -> str:
+def find_minimum_values(dataset: DatasetEntry) -> str:
     """En düşük değerleri bulur"""
-    if not data_info['numeric_columns']:
+    info = dataset.info
+    
+    if not info.numeric_columns:
         return "❌ Sayısal sütun bulunamadı!"
     
     result = "## 🔻 En Düşük Değerler\n\n"
-    for col in data_info['numeric_columns']:
-        min_val = current_data[col].min()
-        min_idx = current_data[col].idxmin()
-        result += f"**{col}:** {min_val:,.2f} (Satır: {min_idx + 1})\n"
+    for col, stats in info.summaries().items():
+        result += f"**{col}:** {stats['min']:,.2f} (Satır: {format_row_position(stats['argmin'])})\n"
     
     return result
 
-def calculate_totals() -> str:
+def calculate_totals(dataset: DatasetEntry) -> str:
     """Toplam değerleri hesaplar"""
-    if not data_info['numeric_columns']:
+    info = dataset.info
+    
+    if not info.numeric_columns:
         return "❌ Sayısal sütun bulunamadı!"
     
     result = "## ➕ Toplam Değerler\n\n"
-    for col in data_info['numeric_columns']:
-        total = current_data[col].sum()
-        result += f"**{col}:** {total:,.2f}\n"
+    for col, stats in info.summaries().items():
+        result += f"**{col}:** {stats['sum']:,.2f}\n"
     
     return result
 
-def calculate_averages() -> str:
+def calculate_averages(dataset: DatasetEntry) -> str:
     """Ortalama değerleri hesaplar"""
-    if not data_info['numeric_columns']:
+    info = dataset.info
+    
+    if not info.numeric_columns:
         return "❌ Sayısal sütun bulunamadı!"
     
     result = "## 📊 Ortalama Değerler\n\n"
-    for col in data_info['numeric_columns']:
-        avg = current_data[col].mean()
-        result += f"**{col}:** {avg:.2f}\n"
+    for col, stats in info.summaries().items():
+        result += f"**{col}:** {stats['mean']:.2f}\n"
     
     return result
 
@@ -0,0 +1,25 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    """Her test için boş kayıt defteri, sonuç önbelleği ve geçici önbellek dizini kurar"""
+    monkeypatch.setattr(server, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(server, "OUT_OF_CORE_DIR", str(tmp_path / "partitions"))
+    monkeypatch.setattr(server, "registry", server.DatasetRegistry(server.DATASET_MEMORY_BUDGET_MB))
+    monkeypatch.setattr(server, "result_cache", server.ResultCache(server.RESULT_CACHE_SIZE))
+    return server
+
+
+def call_tool(name, arguments):
+    """Aracı çalıştırıp metin çıktısını döndürür"""
+    result = asyncio.run(server.handle_call_tool(name, arguments))
+    return result[0].text
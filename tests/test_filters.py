@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import call_tool
+
+
+@pytest.fixture
+def sales(state, tmp_path, monkeypatch):
+    # İndeks ilk sorguda kurulur
+    monkeypatch.setattr(state, "INDEX_MIN_LOOKUPS", 1)
+    path = tmp_path / "sales.csv"
+    pd.DataFrame({"sales": [100, 300, 200, 300, 500, 100], "region": list("abcabc")}).to_csv(path, index=False)
+    call_tool("load_data", {"file_path": str(path)})
+    return state.registry.get()
+
+
+@pytest.mark.parametrize("hash_keys", [1_000_000, 0])
+@pytest.mark.parametrize("values", [[300, 300], [300, 300.0, 100], [700, 700], [500, 100, 500]])
+def test_indexed_in_matches_isin(state, sales, monkeypatch, hash_keys, values):
+    # hash_keys=0: hash tablosu kurulmaz, sıralı indeksle searchsorted kullanılır
+    monkeypatch.setattr(state, "HASH_INDEX_MAX_KEYS", hash_keys)
+    expression = {"column": "sales", "operator": "in", "value": values}
+    
+    positions = state.evaluate_filter(sales, expression)
+    
+    assert sales.indexes.get("sales") is not None
+    expected = np.flatnonzero(sales.data["sales"].isin(values).to_numpy())
+    np.testing.assert_array_equal(positions, expected)
+
+
+def test_filter_tool_counts_duplicate_values_once(state, sales):
+    text = call_tool("filter_data", {"column": "sales", "operator": "in", "value": [300, 300], "save_as": "secim"})
+    
+    assert "❌" not in text
+    assert state.registry.get("secim").info.shape[0] == 2
@@ -0,0 +1,60 @@
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import call_tool
+
+RECORDS = [
+    {"id": 1, "price": 0.1, "qty": 3, "name": "a"},
+    {"id": 2, "price": 1234.5678901234, "qty": 7, "name": "b"},
+    {"id": 3, "price": 2.25, "qty": 11, "name": "c"},
+    {"id": 4, "price": 3.3, "qty": 2, "name": "d"},
+    {"id": 5, "price": 9.875, "qty": 1, "name": "e"},
+]
+
+
+def write_json(path, lines):
+    with open(path, "w", encoding="utf-8") as handle:
+        if lines:
+            handle.write("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+        else:
+            json.dump(RECORDS, handle)
+
+
+@pytest.mark.parametrize("suffix", [".json", ".ndjson"])
+def test_json_load_matches_read_json(state, tmp_path, suffix):
+    path = tmp_path / f"records{suffix}"
+    write_json(path, lines=suffix == ".ndjson")
+    expected = pd.read_json(path, lines=suffix == ".ndjson")
+    
+    # İkinci yükleme önbellekten gelir; iki yolda da tipler pd.read_json ile aynı kalmalı
+    for _ in range(2):
+        assert "❌" not in call_tool("load_data", {"file_path": str(path), "streaming": False})
+        entry = state.registry.get()
+        assert entry.load_info["mode"] in ("standard", "cache")
+        pd.testing.assert_frame_equal(entry.data, expected)
+
+
+def test_streaming_json_load_keeps_values(state, tmp_path):
+    path = tmp_path / "records.json"
+    write_json(path, lines=False)
+    
+    call_tool("load_data", {"file_path": str(path), "streaming": True, "use_cache": False})
+    entry = state.registry.get()
+    assert entry.load_info["mode"] == "streaming"
+    pd.testing.assert_frame_equal(entry.data, pd.read_json(path), check_dtype=False)
+
+
+def test_compact_leaves_nested_json_columns(state, tmp_path):
+    path = tmp_path / "nested.json"
+    records = [{"id": i, "kind": "ab"[i % 2], "meta": {"tags": ["x", str(i)]}, "items": [i, i + 1]} for i in range(20)]
+    path.write_text(json.dumps(records), encoding="utf-8")
+    
+    text = call_tool("load_data", {"file_path": str(path), "compact": True})
+    
+    assert "❌" not in text
+    data = state.registry.get().data
+    assert data["kind"].dtype == "category"
+    assert data["meta"].tolist() == [record["meta"] for record in records]
+    assert data["items"].tolist() == [record["items"] for record in records]
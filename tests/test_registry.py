@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from conftest import call_tool
+
+
+def test_budget_evicts_only_least_recently_used(state, tmp_path):
+    # Her veri seti ~0.95 MB; 2.5 MB bütçede yalnızca en eskisi çıkarılmalı
+    state.registry.memory_budget = 2.5 * 1024 * 1024
+    for name in ["a", "b", "c"]:
+        path = tmp_path / f"{name}.csv"
+        pd.DataFrame({"x": np.arange(62_500), "y": np.arange(62_500) * 2}).to_csv(path, index=False)
+        assert "❌" not in call_tool("load_data", {"dataset": name, "file_path": str(path)})
+    
+    loaded = {name: entry.loaded for name, entry in state.registry.entries.items()}
+    assert loaded == {"a": False, "b": True, "c": True}
+
+
+def test_evicted_dataset_reports_no_resident_memory(state, tmp_path):
+    state.registry.memory_budget = 1.5 * 1024 * 1024
+    for name in ["a", "b"]:
+        path = tmp_path / f"{name}.csv"
+        pd.DataFrame({"x": np.arange(62_500), "y": np.arange(62_500) * 2}).to_csv(path, index=False)
+        call_tool("load_data", {"dataset": name, "file_path": str(path)})
+    
+    evicted = state.registry.entries["a"]
+    assert not evicted.loaded
+    assert evicted.memory_bytes == 0
+    assert evicted.disk_bytes > 0
+    
+    # Tekrar erişimde veri diskten geri yüklenir
+    assert state.registry.get("a").data["y"].sum() == np.arange(62_500).sum() * 2